@@ -5,6 +5,7 @@ Generates Excel files from extracted invoice data in the required accounting for
 
 import pandas as pd
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Dict, Any
 import logging
 
@@ -23,12 +24,16 @@ EXCEL_COLUMNS = [
 ]
 
 
+@lru_cache(maxsize=1024)
 def _parse_invoice_date(
     invoice_date: str
 ) -> tuple:
     """
     Parse and convert invoice date.
     
+    Cached, as all line items of an invoice (and often a whole monthly
+    batch) share one date; an invalid date is logged once.
+    
     Returns:
         Tuple of (beleg_dat, buch_jahr, buch_monat)
     """
@@ -68,9 +73,46 @@ def _build_booking_text(
     return ' '.join(parts) if parts else ''
 
 
+def _row_template(config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build the per-batch part of an Excel row from the configuration.
+    
+    Holds every column in EXCEL_COLUMNS order; _create_row copies it and
+    fills in the item-specific columns.
+    """
+    return {
+        'SATZART': config.get('SATZART', 'D'),
+        'FIRMA': config.get('FIRMA', ''),
+        'BELEG_NR': None,
+        'BELEG_DAT': None,
+        'SOLL_HABEN': config.get('SOLL_HABEN', ''),
+        'BUCH_KREIS': config.get('BUCH_KREIS', ''),
+        'BUCH_JAHR': None,
+        'BUCH_MONAT': None,
+        'DEBI_KREDI': None,
+        'BETRAG': None,
+        'RECHNUNG': None,
+        'leer': None,
+        'BUCH_TEXT': None,
+        'HABENKONTO': config.get('HABENKONTO', ''),
+        'SOLLKONTO': None,
+        'leer_1': None,
+        'KOSTSTELLE': config.get('KOSTSTELLE', ''),
+        'KOSTTRAGER': config.get('KOSTTRAGER', ''),
+        'Kostenträgerbezeichnung': config.get(
+            'Kostenträgerbezeichnung', ''
+        ),
+        'Bebuchbar': config.get('Bebuchbar', 'Ja'),
+        'Debitoren.Bezeichnung': None,
+        'Debitoren.Aktuelle Anschrift Anschrift-Zusatz': None,
+        'AbgBenutzerdefiniert': None
+    }
+
+
 def _create_row(
     item: Dict[str, Any],
-    config: Dict[str, Any]
+    config: Dict[str, Any],
+    template: Dict[str, Any] = None
 ) -> Dict[str, Any]:
     """
     Create a single row for the Excel file.
@@ -78,6 +120,7 @@ def _create_row(
     Args:
         item: Invoice line item
         config: Configuration dictionary
+        template: Result of _row_template(config), built here if omitted
         
     Returns:
         Dictionary representing one Excel row
@@ -95,37 +138,35 @@ def _create_row(
     
     buch_text = _build_booking_text(config, item)
     
-    row = {
-        'SATZART': config.get('SATZART', 'D'),
-        'FIRMA': config.get('FIRMA', ''),
-        'BELEG_NR': item.get('invoice_number', ''),
-        'BELEG_DAT': beleg_dat,
-        'SOLL_HABEN': config.get('SOLL_HABEN', ''),
-        'BUCH_KREIS': config.get('BUCH_KREIS', ''),
-        'BUCH_JAHR': buch_jahr,
-        'BUCH_MONAT': buch_monat,
-        'DEBI_KREDI': item.get('customer_number', ''),
-        'BETRAG': betrag,
-        'RECHNUNG': item.get('invoice_number', ''),
-        'leer': None,
-        'BUCH_TEXT': buch_text,
-        'HABENKONTO': config.get('HABENKONTO', ''),
-        'SOLLKONTO': None,
-        'leer_1': None,
-        'KOSTSTELLE': config.get('KOSTSTELLE', ''),
-        'KOSTTRAGER': config.get('KOSTTRAGER', ''),
-        'Kostenträgerbezeichnung': config.get(
-            'Kostenträgerbezeichnung', ''
-        ),
-        'Bebuchbar': config.get('Bebuchbar', 'Ja'),
-        'Debitoren.Bezeichnung': None,
-        'Debitoren.Aktuelle Anschrift Anschrift-Zusatz': None,
-        'AbgBenutzerdefiniert': None
-    }
+    row = (template or _row_template(config)).copy()
+    row['BELEG_NR'] = item.get('invoice_number', '')
+    row['BELEG_DAT'] = beleg_dat
+    row['BUCH_JAHR'] = buch_jahr
+    row['BUCH_MONAT'] = buch_monat
+    row['DEBI_KREDI'] = item.get('customer_number', '')
+    row['BETRAG'] = betrag
+    row['RECHNUNG'] = item.get('invoice_number', '')
+    row['BUCH_TEXT'] = buch_text
     
     return row
 
 
+def open_excel_writer(output_path: str) -> pd.ExcelWriter:
+    """
+    ExcelWriter for an export: xlsxwriter if installed, else openpyxl.
+    
+    URL-like text stays plain text. xlsxwriter's constant_memory is left
+    off because it drops cells that to_excel writes out of row order.
+    """
+    try:
+        return pd.ExcelWriter(
+            output_path, engine='xlsxwriter',
+            engine_kwargs={'options': {'strings_to_urls': False}}
+        )
+    except ImportError:
+        return pd.ExcelWriter(output_path, engine='openpyxl')
+
+
 def generate_excel(
     invoice_data: List[Dict[str, Any]],
     output_path: str,
@@ -143,7 +184,8 @@ def generate_excel(
         Generated DataFrame
     """
     try:
-        rows = [_create_row(item, config) for item in invoice_data]
+        template = _row_template(config)
+        rows = [_create_row(item, config, template) for item in invoice_data]
         
         # Create DataFrame
         df = pd.DataFrame(rows, columns=EXCEL_COLUMNS)
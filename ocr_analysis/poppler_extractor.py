@@ -15,6 +15,24 @@ import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Pre-compile regex patterns used per line / per OCR fragment
+NOISE_PATTERNS = [
+    re.compile(r'[_\-—–]{3,}'),  # Multiple dashes/underscores
+    re.compile(r'[\.]{3,}'),  # Multiple dots
+    re.compile(r'[,;]{2,}'),  # Multiple punctuation
+    re.compile(r'[\|]{2,}'),  # Multiple pipes
+    re.compile(r'[\'"`]{2,}'),  # Multiple quotes
+    re.compile(r'\s+[_\-—]\s+'),  # Isolated dashes
+]
+OCR_SPECIAL_CHARS_PATTERN = re.compile(r'[^\w\s\.,\-/()€$]', re.UNICODE)
+WHITESPACE_PATTERN = re.compile(r'\s+')
+# Line items
+CURRENCY_PATTERN = re.compile(r"\d{1,3}(?:\.\d{3})*,\d{2}")  # German formatted number
+TOTAL_LINE_PATTERN = re.compile(r'Rechnungsbetrag|Gesamtbetrag|Endbetrag|Summe', re.IGNORECASE)
+HEADER_LINE_PATTERN = re.compile(r'Leistung\s+Std')
+QUANTITY_PATTERN = re.compile(r'(\d{1,3}[,.]\d{2}|\d{1,3})\s*(Stunden|Std|Tage|x)', re.IGNORECASE)
+ONLY_NUMBERS_PATTERN = re.compile(r'[0-9 .,/:-]+')
+
 
 class PopperExtractor:
     def __init__(self):
@@ -435,30 +453,16 @@ class PopperExtractor:
             return text
         
         # Remove common OCR artifacts and noise characters
-        noise_patterns = [
-            r'[_\-—–]{3,}',  # Multiple dashes/underscores
-            r'[\.]{3,}',  # Multiple dots
-            r'[,;]{2,}',  # Multiple punctuation
-            r'[\|]{2,}',  # Multiple pipes
-            r'[\'"`]{2,}',  # Multiple quotes
-            r'\s+[_\-—]\s+',  # Isolated dashes
-        ]
-        
         cleaned = text
-        for pattern in noise_patterns:
-            cleaned = re.sub(pattern, ' ', cleaned)
+        for pattern in NOISE_PATTERNS:
+            cleaned = pattern.sub(' ', cleaned)
         
         # Remove special Unicode characters often from OCR errors
         # Keep letters, numbers, spaces, and common punctuation
-        cleaned = re.sub(
-            r'[^\w\s\.,\-/()€$]',
-            '',
-            cleaned,
-            flags=re.UNICODE
-        )
+        cleaned = OCR_SPECIAL_CHARS_PATTERN.sub('', cleaned)
         
         # Remove extra whitespace
-        cleaned = re.sub(r'\s+', ' ', cleaned)
+        cleaned = WHITESPACE_PATTERN.sub(' ', cleaned)
         cleaned = cleaned.strip()
         
         return cleaned
@@ -708,29 +712,27 @@ class PopperExtractor:
         
         # 5b. Extract detailed line items (each row of services with final amount)
         line_items = []
-        currency_pattern = r"\d{1,3}(?:\.\d{3})*,\d{2}"  # German formatted number
         keywords = [
             'WG', 'Gruppe', 'Taschengeld', 'Bekleidung', 'Bekleidungsgeld',
             'Schillwiese', 'UMA', 'UMAs', 'Heim', 'Unterbringung'
         ]
-        qty_pattern = re.compile(r'(\d{1,3}[,.]\d{2}|\d{1,3})\s*(Stunden|Std|Tage|x)', re.IGNORECASE)
         for raw_line in text.splitlines():
             line = raw_line.strip()
             if not line:
                 continue
             # Skip total lines
-            if re.search(r'Rechnungsbetrag|Gesamtbetrag|Endbetrag|Summe', line, re.IGNORECASE):
+            if TOTAL_LINE_PATTERN.search(line):
                 continue
             # Skip lines that are just headers
-            if re.search(r'Leistung\s+Std', line):
+            if HEADER_LINE_PATTERN.search(line):
                 continue
-            amounts = re.findall(currency_pattern, line)
+            amounts = CURRENCY_PATTERN.findall(line)
             if not amounts:
                 continue
             amount_str = amounts[-1]
             cut_index = line.rfind(amount_str)
             description = line[:cut_index].strip()
-            description = re.sub(currency_pattern, '', description).strip()
+            description = CURRENCY_PATTERN.sub('', description).strip()
             description_clean = self._clean_ocr_text(description)
             # Determine acceptance
             # Convert amount to cents
@@ -740,8 +742,8 @@ class PopperExtractor:
             except Exception:
                 pass
             has_keyword = any(k.lower() in description_clean.lower() for k in keywords)
-            has_qty = bool(qty_pattern.search(line))
-            only_numbers = bool(re.fullmatch(r'[0-9 .,/:-]+', description_clean))
+            has_qty = bool(QUANTITY_PATTERN.search(line))
+            only_numbers = bool(ONLY_NUMBERS_PATTERN.fullmatch(description_clean))
             # Reject tiny amounts (< 1000 cents) unless keyword or quantity present
             accept = True
             if amt_cents_try < 1000 and not (has_keyword or has_qty):
@@ -4,7 +4,11 @@ Extracts Lernförderung invoice data from PDF files.
 """
 
 import pdfplumber
+import io
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
 from datetime import datetime
 from typing import List, Dict, Any
 import logging
@@ -44,6 +48,19 @@ CARE_DEDUCTION_PATTERN = re.compile(
 CARE_TOTAL_PATTERN = re.compile(r'Rechnungsbetrag\s*([0-9\.]+,\d{2})')
 CARE_PAYMENT_PATTERN = re.compile(r'Zahlbetrag\s*([0-9\.]+,\d{2})')
 
+# German amount "1.234,56 €" -> "1234.56" in a single translate pass
+AMOUNT_TRANSLATION = str.maketrans({'€': None, '.': None, ',': '.'})
+
+
+def _amount_to_float(s: str) -> float:
+    """Parse a German formatted amount, 0.0 if empty or unparseable."""
+    if not s:
+        return 0.0
+    try:
+        return float(s.translate(AMOUNT_TRANSLATION))
+    except ValueError:
+        return 0.0
+
 
 def extract_invoices(pdf_path: str) -> List[Dict[str, Any]]:
     """
@@ -55,24 +72,112 @@ def extract_invoices(pdf_path: str) -> List[Dict[str, Any]]:
     Returns:
         List of dictionaries containing extracted invoice data
     """
-    invoices = []
+    try:
+        return _extract_page_range(pdf_path, 0, None)
+    except Exception as e:
+        logger.error(f"Error opening PDF {pdf_path}: {str(e)}")
+        raise
+
+
+def extract_invoices_parallel(
+    pdf_path: str, max_workers: int = None, pages_per_task: int = 4,
+    progress_callback=None
+) -> List[Dict[str, Any]]:
+    """
+    Extract all invoice data from a PDF file, pages spread over processes.
     
+    The file is read once and its bytes are put in shared memory; each
+    worker opens the PDF from there and handles a block of pages_per_task
+    pages. Results come back in page order, so the output equals
+    extract_invoices(pdf_path).
+    
+    Args:
+        pdf_path: Path to the PDF file
+        max_workers: Process count (default: CPU count)
+        pages_per_task: Pages handled per submitted task
+        progress_callback: Called as (pages_done, page_count) whenever a
+            block of pages finishes, from the calling thread
+        
+    Returns:
+        List of dictionaries containing extracted invoice data
+    """
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            for page_num, page in enumerate(pdf.pages, 1):
-                try:
-                    invoice_data = extract_page_data(page, page_num)
-                    if invoice_data:
-                        invoices.extend(invoice_data)
-                except Exception as e:
-                    logger.warning(
-                        f"Error processing page {page_num}: {str(e)}"
-                    )
-                    continue
+        with open(pdf_path, 'rb') as f:
+            pdf_bytes = f.read()
+        with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+            page_count = len(pdf.pages)
     except Exception as e:
         logger.error(f"Error opening PDF {pdf_path}: {str(e)}")
         raise
     
+    starts = range(0, page_count, pages_per_task)
+    workers = min(max_workers or os.cpu_count() or 1, len(starts))
+    if workers <= 1:
+        invoices = _extract_page_range(io.BytesIO(pdf_bytes), 0, None)
+        if progress_callback:
+            progress_callback(page_count, page_count)
+        return invoices
+    
+    size = len(pdf_bytes)
+    shm = shared_memory.SharedMemory(create=True, size=size)
+    try:
+        shm.buf[:size] = pdf_bytes
+        del pdf_bytes
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(
+                    _extract_shared_range, shm.name, size,
+                    start, start + pages_per_task
+                ): min(pages_per_task, page_count - start)
+                for start in starts
+            }
+            if progress_callback:
+                done = 0
+                for future in as_completed(futures):
+                    done += futures[future]
+                    progress_callback(done, page_count)
+            # Dicts keep insertion order, i.e. page order
+            return [item for future in futures for item in future.result()]
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _extract_shared_range(shm_name: str, size: int, start: int, stop) -> List[Dict[str, Any]]:
+    """Worker side of extract_invoices_parallel: pages start:stop of the
+    PDF whose bytes are in the shared memory block shm_name."""
+    try:
+        # The parent owns (and unlinks) the block
+        shm = shared_memory.SharedMemory(name=shm_name, track=False)
+    except TypeError:
+        # Python < 3.13 has no track argument
+        shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        pdf_bytes = bytes(shm.buf[:size])
+    finally:
+        shm.close()
+    return _extract_page_range(io.BytesIO(pdf_bytes), start, stop)
+
+
+def _extract_page_range(pdf_source, start: int, stop) -> List[Dict[str, Any]]:
+    """Extract the pages pdf.pages[start:stop] (page numbers stay 1-based).
+
+    pdf_source is a path or a binary file object.
+    """
+    invoices = []
+    
+    with pdfplumber.open(pdf_source) as pdf:
+        for page_num, page in enumerate(pdf.pages[start:stop], start + 1):
+            try:
+                invoice_data = extract_page_data(page, page_num)
+                if invoice_data:
+                    invoices.extend(invoice_data)
+            except Exception as e:
+                logger.warning(
+                    f"Error processing page {page_num}: {str(e)}"
+                )
+                continue
+    
     return invoices
 
 
@@ -145,17 +250,7 @@ def extract_page_data(page, page_num: int) -> List[Dict[str, Any]]:
             )
             month_year = month_year_match.group(1) if month_year_match else ''
             
-            def to_float(s: str) -> float:
-                if not s:
-                    return 0.0
-                cleaned = s.replace('€', '').replace('.', '')
-                cleaned = cleaned.replace(',', '.').strip()
-                try:
-                    return float(cleaned)
-                except ValueError:
-                    return 0.0
-            
-            amount_val = to_float(amt)
+            amount_val = _amount_to_float(amt)
             
             item = {
                 'page_num': page_num,
@@ -179,7 +274,7 @@ def extract_page_data(page, page_num: int) -> List[Dict[str, Any]]:
             m = pattern.search(text)
             if not m:
                 return 0.0
-            return float(m.group(1).replace('.', '').replace(',', '.'))
+            return float(m.group(1).translate(AMOUNT_TRANSLATION))
         
         netto = parse_amount(CARE_NETTO_PATTERN)
         total = parse_amount(CARE_TOTAL_PATTERN)
@@ -1,18 +1,106 @@
 """
 Multi-Project Invoice Processing Application
 Supports: PDF Reader, Excel Transformer, and Scanned PDF (OCR - future)
+
+Optional: python-calamine speeds up reading the mapping and OCR workbooks;
+without it openpyxl is used.
 """
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from tkinter import font as tkfont
-import threading
+import os
+import string
+import queue
+import hashlib
+import pickle
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
+from bisect import bisect_left
+from functools import partial
 from pathlib import Path
-from pdf_extractor import extract_invoices
-from excel_generator import generate_excel
-from bereitspf_transformer import transform_excel as bereitspf_transform
-import pandas as pd
-import shutil
+
+# Bump whenever the extractors change their output so stale cache entries are ignored
+CACHE_VERSION = 1
+
+
+def _pdf_cache_key(pdf_path):
+    """Cheap content key for a PDF: SHA-1 over its size and first/last 4 KB."""
+    h = hashlib.sha1()
+    size = os.path.getsize(pdf_path)
+    h.update(str(size).encode())
+    with open(pdf_path, 'rb') as f:
+        h.update(f.read(4096))
+        if size > 4096:
+            f.seek(-4096, os.SEEK_END)
+            h.update(f.read(4096))
+    return h.hexdigest()
+
+
+def _read_excel_fast(path, **kwargs):
+    """pd.read_excel via the calamine engine when available, else openpyxl."""
+    import pandas as pd
+    try:
+        return pd.read_excel(path, engine='calamine', **kwargs)
+    except (ImportError, ValueError):
+        # python-calamine missing, or pandas < 2.2 ("Unknown engine")
+        return pd.read_excel(path, engine='openpyxl', **kwargs)
+
+
+def _run_ocr_extraction(pdf_path, progress_queue):
+    """Run OCR extraction in a worker process, reporting page progress via queue."""
+    try:
+        from ocr_analysis.poppler_extractor import PopperExtractor
+    except Exception as ie:
+        raise ImportError(f"OCR dependencies missing or import failed: {ie}")
+
+    def report_progress(current, total, elapsed_time):
+        progress_queue.put((current, total, elapsed_time))
+
+    extractor = PopperExtractor()
+    return extractor.extract_pdf(
+        pdf_path, output_folder='temp_analysis',
+        progress_callback=report_progress
+    )
+
+
+def _date_parts(dates):
+    """Split a Series of parsed dates into BELEG_DAT, BUCH_JAHR and BUCH_MONAT columns.
+
+    Unparseable dates (NaT) become empty strings, matching the per-row behaviour.
+    """
+    valid = dates.notna()
+    beleg_dat = dates.dt.strftime('%Y%m%d').where(valid, '')
+    buch_jahr = dates.dt.year.astype('Int64').astype(object).where(valid, '')
+    buch_monat = dates.dt.month.astype('Int64').astype(object).where(valid, '')
+    return beleg_dat, buch_jahr, buch_monat
+
+
+def _euros_to_cents(values):
+    """Convert a Series of OCR amounts ("1.234,56") to integer cents.
+
+    Returns a nullable Int64 Series; missing or unparseable values are <NA>.
+    Plain numbers above 1000 without a comma are taken to be cents already.
+    """
+    import pandas as pd
+    # None/NaN/'' fall out as unparseable strings, like in the per-row version
+    s = values.map(str).str.strip()
+    
+    # Check if already a large number (likely cents)
+    num = pd.to_numeric(s.str.replace(',', '.', regex=False), errors='coerce')
+    already_cents = (num > 1000) & ~s.str.contains(',', regex=False)
+    
+    # Convert from euros: 1.234,56 -> 123456 cents
+    commas = s.str.count(',')
+    parts = s.str.extract(r'^([^,]*),([^,]*)$')
+    euros = s.where(commas == 0)
+    euros = euros.where(commas != 1, parts[0].str.replace('.', '', regex=False) + '.' + parts[1])
+    cents = pd.to_numeric(euros, errors='coerce') * 100
+    
+    result = cents.where(~already_cents, num)
+    result = result.where(result.abs() < float('inf'))
+    return result.round().astype('Int64')
 
 
 class ModernStyle:
@@ -33,16 +121,29 @@ class EditableTreeview(ttk.Treeview):
     def __init__(self, master, **kw):
         super().__init__(master, **kw)
         self.bind("<Double-1>", self.on_double_click)
+        
+        # One overlay Entry is reused for every edit; the cell being
+        # edited is tracked in _edit_row / _edit_col
+        self._edit_entry = tk.Entry(self, bg=ModernStyle.BG_INPUT, fg=ModernStyle.TEXT_PRIMARY, 
+                                    insertbackground=ModernStyle.TEXT_PRIMARY, relief=tk.FLAT)
+        self._edit_row = None
+        self._edit_col = None
+        # (item, column index) of the last saved edit, for <<TreeviewEdit>> handlers
+        self.last_edit = None
+        self._edit_entry.bind("<Return>", self._save_edit)
+        self._edit_entry.bind("<FocusOut>", self._save_edit)
+        self._edit_entry.bind("<Escape>", self._cancel_edit)
 
     def on_double_click(self, event):
         """Handle double click to edit cell"""
-        region = self.identify("region", event.x, event.y)
-        if region != "cell":
+        # One Tcl round-trip: the two-argument form of "identify" returns
+        # ("cell", item, "#n") for a data cell, so region, row and column
+        # come back together
+        info = self.tk.splitlist(self.tk.call(self._w, "identify", event.x, event.y))
+        if len(info) != 3 or str(info[0]) != "cell":
             return
             
-        column = self.identify_column(event.x)
-        row_id = self.identify_row(event.y)
-        
+        row_id, column = str(info[1]), str(info[2])
         if not row_id:
             return
             
@@ -52,30 +153,120 @@ class EditableTreeview(ttk.Treeview):
         
         x, y, width, height = self.bbox(row_id, column)
         
-        entry = tk.Entry(self, bg=ModernStyle.BG_INPUT, fg=ModernStyle.TEXT_PRIMARY, 
-                        insertbackground=ModernStyle.TEXT_PRIMARY, relief=tk.FLAT)
-        entry.place(x=x, y=y, width=width, height=height)
-        entry.insert(0, current_value)
-        entry.select_range(0, tk.END)
-        entry.focus()
-        
-        def save_edit(event=None):
-            new_value = entry.get()
-            current_values = list(self.item(row_id, "values"))
-            current_values[col_idx] = new_value
-            self.item(row_id, values=current_values)
-            entry.destroy()
-            self.event_generate("<<TreeviewEdit>>")
-            
-        def cancel_edit(event=None):
-            entry.destroy()
-            
-        entry.bind("<Return>", save_edit)
-        entry.bind("<FocusOut>", save_edit)
-        entry.bind("<Escape>", cancel_edit)
+        self._edit_row = row_id
+        self._edit_col = col_idx
+        self._edit_entry.delete(0, tk.END)
+        self._edit_entry.insert(0, current_value)
+        self._edit_entry.select_range(0, tk.END)
+        self._edit_entry.place(x=x, y=y, width=width, height=height)
+        self._edit_entry.focus()
+        
+    def _save_edit(self, event=None):
+        row_id, col_idx = self._edit_row, self._edit_col
+        if row_id is None:
+            return
+        self._edit_row = None
+        self._edit_entry.place_forget()
+        if not self.exists(row_id):
+            return
+        new_value = self._edit_entry.get()
+        current_values = list(self.item(row_id, "values"))
+        current_values[col_idx] = new_value
+        self.item(row_id, values=current_values)
+        self.last_edit = (row_id, col_idx)
+        self.event_generate("<<TreeviewEdit>>")
+        
+    def _cancel_edit(self, event=None):
+        self._edit_row = None
+        self._edit_entry.place_forget()
+
+
+class SettingsForm(tk.Frame):
+    """Default-value form: one editable Treeview row per field.
+
+    FIRMA keeps a Combobox so it can be picked from the mapping DB. Its
+    choices arrive later via set_firma_options; it is read-only, except
+    that with free_text_firma it becomes editable when no options are found.
+    """
+    def __init__(self, master, fields, free_text_firma=False):
+        super().__init__(master, bg=ModernStyle.BG_CARD)
+        self.fields = [field for field, _ in fields]
+        self.firma_var = None
+        self.firma_combo = None
+        self._free_text_firma = free_text_firma
+        
+        grid_fields = [(f, d) for f, d in fields if f != 'FIRMA']
+        for field, default in fields:
+            if field != 'FIRMA':
+                continue
+            tk.Label(self, text=field, bg=ModernStyle.BG_CARD, fg=ModernStyle.TEXT_SECONDARY, font=('Segoe UI', 9)).pack(anchor=tk.W)
+            self.firma_var = tk.StringVar(value=default)
+            self.firma_combo = ttk.Combobox(
+                self, textvariable=self.firma_var, values=[],
+                state='readonly', font=('Segoe UI', 9)
+            )
+            self.firma_combo.pack(fill=tk.X, pady=(0, 5))
+            self._firma_warning = tk.Label(
+                self, text="⚠ kostentreäger_info_3.xlsx fehlt",
+                bg=ModernStyle.BG_CARD, fg='#ff9800', font=('Segoe UI', 8)
+            )
+        
+        self.grid_view = EditableTreeview(self, columns=("value",), show="tree headings", height=len(grid_fields))
+        self.grid_view.heading("#0", text="Feld")
+        self.grid_view.heading("value", text="Wert")
+        self.grid_view.column("#0", width=150, stretch=False)
+        self.grid_view.column("value", width=150, stretch=True)
+        for field, default in grid_fields:
+            self.grid_view.insert("", tk.END, iid=field, text=field, values=(default,))
+        self.grid_view.pack(fill=tk.BOTH, expand=True)
+    
+    def set_firma_options(self, options):
+        """Fill the FIRMA choices (no-op for forms without FIRMA)"""
+        if self.firma_combo is None:
+            return
+        self.firma_combo.config(values=options)
+        if options:
+            self.firma_combo.config(state='readonly')
+            self._firma_warning.pack_forget()
+        else:
+            if self._free_text_firma:
+                self.firma_combo.config(state='normal')
+            self._firma_warning.pack(anchor=tk.W, pady=(0, 5), after=self.firma_combo)
+    
+    def values(self):
+        """Current values as a {field: value} dict, in field order"""
+        return {
+            field: (
+                self.firma_var.get() if field == 'FIRMA'
+                else self.grid_view.set(field, "value")
+            )
+            for field in self.fields
+        }
 
 
 class MultiProjectApp:
+    # Rows inserted per idle callback when filling the data grid
+    _TREE_CHUNK = 500
+    
+    # Data grid column widths; columns not listed get 100
+    _COLUMN_WIDTHS = {
+        'BUCH_TEXT': 250, 'Kostenträgerbezeichnung': 250,
+        'SATZART': 60, 'SOLL_HABEN': 60, 'BUCH_MONAT': 60,
+    }
+    
+    # Column order of the exported booking sheet
+    _EXPORT_COLUMNS = (
+        'SATZART', 'FIRMA', 'BELEG_NR', 'BELEG_DAT',
+        'SOLL_HABEN', 'BUCH_KREIS',
+        'BUCH_JAHR', 'BUCH_MONAT', 'DEBI_KREDI', 'BETRAG',
+        'RECHNUNG', 'leer',
+        'BUCH_TEXT', 'HABENKONTO', 'SOLLKONTO', 'leer_1', 'KOSTSTELLE',
+        'KOSTTRAGER', 'Kostenträgerbezeichnung', 'Bebuchbar',
+        'Debitoren.Bezeichnung',
+        'Debitoren.Aktuelle Anschrift Anschrift-Zusatz',
+        'AbgBenutzerdefiniert',
+    )
+
     def __init__(self, root):
         self.root = root
         self.root.title("Rechnungsverarbeitung | Invoice Processing")
@@ -95,22 +286,53 @@ class MultiProjectApp:
         
         # Data storage
         self.processed_data = []
+        # Bumped by every grid refill; stale chunk callbacks check it and stop
+        self._tree_generation = 0
+        # True while _populate_tree still has chunks to insert
+        self._tree_filling = False
         self.current_project = "PDF Reader"
         
         # PDF Reader specific
         self.raw_pdf_data = []
-        self.pdf_path = None
+        # Files for the next extraction: one PDF, or every PDF under a folder
+        self.pdf_paths = []
         self.mapping_data = None
+        # mtime of the mapping_db.xlsx that mapping_data was read from
+        self._mapping_mtime = None
+        # Bumped by every load_stored_mapping; only the latest load is applied
+        self._mapping_load_generation = 0
+        # Lookup tables over mapping_data, see _build_mapping_index
+        self._mapping_index = {}
         # Extended mapping (with FIRMA & DEBI_KREDI details, e.g. kostentreäger_info_3.xlsx)
         self.extended_mapping = None
         self.data_dir = Path("data")
         self.data_dir.mkdir(exist_ok=True)
         self.mapping_file_path = self.data_dir / "mapping_db.xlsx"
+        # Raw extraction results, keyed by PDF content
+        self.cache_dir = self.data_dir / "extraction_cache"
         
         # Excel Transformer specific
         self.template_path = None
         self.source_path = None
         
+        # Extraction runs in worker processes so the Tk loop never blocks.
+        # Results reach the Tk loop as (callback, args) items on _ui_queue,
+        # which _drain_ui_queue empties every 33 ms
+        self._pool_workers = os.cpu_count() or 1
+        self._pool = ProcessPoolExecutor(max_workers=self._pool_workers)
+        self._pending = set()
+        # Workbook reads/writes and the Excel transform are I/O bound and
+        # run on threads instead
+        self._io_pool = ThreadPoolExecutor(max_workers=2)
+        self._ui_queue = queue.SimpleQueue()
+        self._ui_after_id = self.root.after(33, self._drain_ui_queue)
+        self._ocr_manager = None
+        self._ocr_progress_queue = None
+        # Latest OCR progress; flushed to the widgets at most ~30 times/s
+        self._ocr_progress_state = None
+        self._ocr_progress_scheduled = False
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        
         # Fonts
         self.title_font = tkfont.Font(family="Segoe UI", size=24, weight="bold")
         self.header_font = tkfont.Font(family="Segoe UI", size=14, weight="bold")
@@ -118,9 +340,13 @@ class MultiProjectApp:
         self.setup_styles()
         self.create_widgets()
         
-        # Auto-load PDF Reader mapping
-        self.load_stored_mapping()
-        self.load_extended_mapping()
+        # FIRMA choices need pandas and a workbook parse; the forms start
+        # empty and are filled when the I/O thread has them
+        self._submit_io(self._on_firma_options_loaded, self.load_firma_options)
+        
+        # Auto-load PDF Reader mapping once the window has painted
+        self.root.after_idle(self.load_stored_mapping)
+        self.root.after_idle(self.load_extended_mapping)
         
     def setup_styles(self):
         """Configure ttk styles"""
@@ -164,8 +390,42 @@ class MultiProjectApp:
         style.map('Treeview',
                  background=[('selected', ModernStyle.PRIMARY)])
     
+    @property
+    def pdf_config_entries(self):
+        return self.pdf_settings_form.values()
+    
+    @property
+    def excel_config_entries(self):
+        return self.excel_settings_form.values()
+    
+    @property
+    def ocr_config_entries(self):
+        return self.ocr_settings_form.values()
+    
+    def load_firma_options(self):
+        """FIRMA choices for the settings forms (mapping DB, else kostentreäger_info_3.xlsx)"""
+        try:
+            # Primary source: mapping DB if it has FIRMA
+            if self.mapping_data is not None and 'FIRMA' in self.mapping_data.columns:
+                return sorted(set(self.mapping_data['FIRMA'].astype(str).str.strip()))
+            # Fallback: use kostentreäger_info_3.xlsx if present
+            alt_path = Path('kostentreäger_info_3.xlsx')
+            if alt_path.exists():
+                alt_df = _read_excel_fast(alt_path)
+                if 'FIRMA' in alt_df.columns:
+                    return sorted(set(alt_df['FIRMA'].astype(str).str.strip()))
+        except Exception:
+            pass
+        return []
+    
+    def _on_firma_options_loaded(self, future):
+        options = future.result()
+        for form in (self.pdf_settings_form, self.excel_settings_form, self.ocr_settings_form):
+            form.set_firma_options(options)
+    
     def create_widgets(self):
         """Create main UI"""
+        
         # Main container
         main_container = tk.Frame(self.root, bg=ModernStyle.BG_DARK)
         main_container.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
@@ -234,8 +494,7 @@ class MultiProjectApp:
         self.current_project = new_project
         
         # Clear data grid
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self._populate_tree([])
         self.processed_data = []
     
     def create_pdf_reader_ui(self, parent):
@@ -254,6 +513,7 @@ class MultiProjectApp:
         btn_frame.pack(fill=tk.X)
         
         ttk.Button(btn_frame, text="📁 Öffnen", style='Primary.TButton', command=self.select_pdf).pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
+        ttk.Button(btn_frame, text="🗂 Ordner", style='Secondary.TButton', command=self.select_pdf_folder).pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
         self.pdf_extract_btn = ttk.Button(btn_frame, text="🚀 Extrahieren", style='Primary.TButton', command=self.extract_pdf_data, state=tk.DISABLED)
         self.pdf_extract_btn.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(5, 0))
         
@@ -270,117 +530,36 @@ class MultiProjectApp:
         self.pdf_mapping_status = tk.Label(card2, text="⚠️  Keine Datenbank geladen", bg=ModernStyle.BG_CARD, fg='#ff9800', font=('Segoe UI', 9, 'bold'))
         self.pdf_mapping_status.pack(fill=tk.X, pady=(0,  10))
         
-        ttk.Button(card2, text="📂 Datenbank laden", style='Primary.TButton', command=self.upload_pdf_mapping).pack(fill=tk.X)
+        self.pdf_mapping_btn = ttk.Button(card2, text="📂 Datenbank laden", style='Primary.TButton', command=self.upload_pdf_mapping)
+        self.pdf_mapping_btn.pack(fill=tk.X)
         
-        # Settings card with scrollable area
+        # Settings card
         card3 = tk.Frame(parent, bg=ModernStyle.BG_CARD, padx=15, pady=15)
         card3.pack(fill=tk.BOTH, expand=True, pady=(0, 15))
         
         ttk.Label(card3, text="2. Einstellungen", style='Header.TLabel').pack(anchor=tk.W, pady=(0, 5))
         tk.Label(card3, text="Standard-Werte für neue Einträge (anpassbar nach Extraktion)", bg=ModernStyle.BG_CARD, fg=ModernStyle.TEXT_SECONDARY, font=('Segoe UI', 8)).pack(anchor=tk.W, pady=(0, 5))
         
-        canvas = tk.Canvas(card3, bg=ModernStyle.BG_CARD, highlightthickness=0)
-        scrollbar = ttk.Scrollbar(card3, orient="vertical", command=canvas.yview)
-        scroll_frame = tk.Frame(canvas, bg=ModernStyle.BG_CARD)
-        
-        canvas.configure(yscrollcommand=scrollbar.set)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        canvas.create_window((0, 0), window=scroll_frame, anchor="nw")
-        
-        def on_configure(event):
-            canvas.configure(scrollregion=canvas.bbox("all"))
-            canvas.itemconfig(canvas.find_all()[0], width=event.width)
-            
-        scroll_frame.bind("<Configure>", on_configure)
-        
-        self.pdf_config_entries = {}
-        fields = [
-            ('FIRMA', '9251'), ('SATZART', 'D'), ('SOLL_HABEN', 'H'),
-            ('BUCH_KREIS', 'RA'), ('HABENKONTO', '42200'), ('KOSTSTELLE', '190'),
-            ('KOSTTRAGER', '190111512110'), ('Kostenträgerbezeichnung', 'SPFH/HzE Siegen'),
-            ('Bebuchbar', 'Ja'),
-        ]
-        
-        for field, default in fields:
-            f_frame = tk.Frame(scroll_frame, bg=ModernStyle.BG_CARD, pady=5)
-            f_frame.pack(fill=tk.X)
-            tk.Label(
-                f_frame, text=field, bg=ModernStyle.BG_CARD,
-                fg=ModernStyle.TEXT_SECONDARY
-            ).pack(anchor=tk.W)
-            # Use Combobox for FIRMA to pick from mapping DB
-            if field == 'FIRMA':
-                self.firma_var = tk.StringVar(value=default)
-                try:
-                    options = []
-                    # Primary source: mapping DB if it has FIRMA
-                    if (
-                        self.mapping_data is not None and
-                        'FIRMA' in self.mapping_data.columns
-                    ):
-                        options = sorted(
-                            set(
-                                self.mapping_data['FIRMA']
-                                .astype(str).str.strip()
-                            )
-                        )
-                    else:
-                        # Fallback: use kostentreäger_info_3.xlsx if present
-                        try:
-                            from pathlib import Path
-                            alt_path = Path('kostentreäger_info_3.xlsx')
-                            if alt_path.exists():
-                                import pandas as pd
-                                alt_df = pd.read_excel(alt_path)
-                                if 'FIRMA' in alt_df.columns:
-                                    options = sorted(
-                                        set(
-                                            alt_df['FIRMA']
-                                            .astype(str).str.strip()
-                                        )
-                                    )
-                        except Exception:
-                            pass
-                    # Use normal state (editable) if no options found
-                    combo_state = 'readonly' if options else 'normal'
-                    self.firma_combo = ttk.Combobox(
-                        f_frame, textvariable=self.firma_var,
-                        values=options, state=combo_state
-                    )
-                    self.firma_combo.pack(fill=tk.X, ipady=0)
-                    entry_widget = self.firma_combo
-                    # Show warning if no options
-                    if not options:
-                        warn_lbl = tk.Label(
-                            f_frame, text="⚠ kostentreäger_info_3.xlsx fehlt",
-                            bg=ModernStyle.BG_CARD, fg='#ff9800',
-                            font=('Segoe UI', 8)
-                        )
-                        warn_lbl.pack(anchor=tk.W, pady=(2,0))
-                except Exception:
-                    entry = tk.Entry(
-                        f_frame, bg=ModernStyle.BG_INPUT,
-                        fg=ModernStyle.TEXT_PRIMARY, relief=tk.FLAT
-                    )
-                    entry.insert(0, default)
-                    entry.pack(fill=tk.X, ipady=5)
-                    entry_widget = entry
-            else:
-                entry = tk.Entry(
-                    f_frame, bg=ModernStyle.BG_INPUT,
-                    fg=ModernStyle.TEXT_PRIMARY, relief=tk.FLAT
-                )
-                entry.insert(0, default)
-                entry.pack(fill=tk.X, ipady=5)
-                entry_widget = entry
-            self.pdf_config_entries[field] = entry_widget
+        self.pdf_settings_form = SettingsForm(
+            card3,
+            [('FIRMA', '9251'), ('SATZART', 'D'), ('SOLL_HABEN', 'H'),
+             ('BUCH_KREIS', 'RA'), ('HABENKONTO', '42200'), ('KOSTSTELLE', '190'),
+             ('KOSTTRAGER', '190111512110'), ('Kostenträgerbezeichnung', 'SPFH/HzE Siegen'),
+             ('Bebuchbar', 'Ja')],
+            free_text_firma=True
+        )
+        self.pdf_settings_form.pack(fill=tk.BOTH, expand=True)
         
-        tk.Label(scroll_frame, text="BUCH_TEXT Template", bg=ModernStyle.BG_CARD, fg=ModernStyle.TEXT_SECONDARY).pack(anchor=tk.W, pady=(15, 0))
-        self.pdf_buch_text_entry = tk.Entry(scroll_frame, bg=ModernStyle.BG_INPUT, fg=ModernStyle.TEXT_PRIMARY, relief=tk.FLAT)
+        tk.Label(card3, text="BUCH_TEXT Template", bg=ModernStyle.BG_CARD, fg=ModernStyle.TEXT_SECONDARY).pack(anchor=tk.W, pady=(15, 0))
+        self.pdf_buch_text_entry = tk.Entry(card3, bg=ModernStyle.BG_INPUT, fg=ModernStyle.TEXT_PRIMARY, relief=tk.FLAT)
         self.pdf_buch_text_entry.insert(0, "1025 {student} {subject}")
         self.pdf_buch_text_entry.pack(fill=tk.X, ipady=5)
         
+        tk.Label(card3, text="Parallele Prozesse (Extraktion)", bg=ModernStyle.BG_CARD, fg=ModernStyle.TEXT_SECONDARY).pack(anchor=tk.W, pady=(10, 0))
+        self.pdf_workers_entry = tk.Entry(card3, bg=ModernStyle.BG_INPUT, fg=ModernStyle.TEXT_PRIMARY, relief=tk.FLAT)
+        self.pdf_workers_entry.insert(0, str(self._pool_workers))
+        self.pdf_workers_entry.pack(fill=tk.X, ipady=5)
+        
         # Buttons: apply and check matches
         btns = tk.Frame(card3, bg=ModernStyle.BG_CARD)
         btns.pack(fill=tk.X, pady=(10, 0))
@@ -434,98 +613,13 @@ class MultiProjectApp:
         
         ttk.Label(card3, text="3. Standardwerte", style='Header.TLabel').pack(anchor=tk.W, pady=(0, 10))
         
-        # Create container with fixed height
-        defaults_container = tk.Frame(card3, bg=ModernStyle.BG_CARD, height=200)
-        defaults_container.pack(fill=tk.BOTH, expand=False)
-        defaults_container.pack_propagate(False)  # Prevent shrinking
-        
-        canvas = tk.Canvas(defaults_container, bg=ModernStyle.BG_CARD, highlightthickness=0)
-        scrollbar = ttk.Scrollbar(defaults_container, orient="vertical", command=canvas.yview)
-        scroll_frame = tk.Frame(canvas, bg=ModernStyle.BG_CARD)
-        
-        canvas.configure(yscrollcommand=scrollbar.set)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        
-        canvas_window = canvas.create_window((0, 0), window=scroll_frame, anchor="nw")
-        
-        def on_configure(event):
-            canvas.configure(scrollregion=canvas.bbox("all"))
-            # Update canvas window width
-            canvas.itemconfig(canvas_window, width=canvas.winfo_width())
-            
-        scroll_frame.bind("<Configure>", on_configure)
-        canvas.bind("<Configure>", lambda e: canvas.itemconfig(canvas_window, width=e.width))
-        
-        self.excel_config_entries = {}
-        fields = [
-            ('SATZART', 'D'), ('FIRMA', '9241'), ('SOLL_HABEN', 'S'),
-            ('BUCH_KREIS', 'RE'), ('BUCH_JAHR', '2025'), ('BUCH_MONAT', '11'),
-            ('Bebuchbar', 'Ja'),
-        ]
-        
-        for field, default in fields:
-            f_frame = tk.Frame(scroll_frame, bg=ModernStyle.BG_CARD, pady=3)
-            f_frame.pack(fill=tk.X, padx=5)
-            tk.Label(f_frame, text=field, bg=ModernStyle.BG_CARD, fg=ModernStyle.TEXT_SECONDARY, font=('Segoe UI', 9)).pack(anchor=tk.W)
-            
-            # Use Combobox for FIRMA
-            if field == 'FIRMA':
-                firma_var = tk.StringVar(value=default)
-                try:
-                    options = []
-                    if (
-                        self.mapping_data is not None and
-                        'FIRMA' in self.mapping_data.columns
-                    ):
-                        options = sorted(
-                            set(
-                                self.mapping_data['FIRMA']
-                                .astype(str).str.strip()
-                            )
-                        )
-                    else:
-                        try:
-                            from pathlib import Path
-                            alt_path = Path('kostentreäger_info_3.xlsx')
-                            if alt_path.exists():
-                                import pandas as pd
-                                alt_df = pd.read_excel(alt_path)
-                                if 'FIRMA' in alt_df.columns:
-                                    options = sorted(
-                                        set(
-                                            alt_df['FIRMA']
-                                            .astype(str).str.strip()
-                                        )
-                                    )
-                        except Exception:
-                            pass
-                    combo = ttk.Combobox(
-                        f_frame, textvariable=firma_var,
-                        values=options, state='readonly',
-                        font=('Segoe UI', 9)
-                    )
-                    combo.pack(fill=tk.X, ipady=0)
-                    entry_widget = combo
-                except Exception:
-                    entry = tk.Entry(
-                        f_frame, bg=ModernStyle.BG_INPUT,
-                        fg=ModernStyle.TEXT_PRIMARY, relief=tk.FLAT,
-                        font=('Segoe UI', 9)
-                    )
-                    entry.insert(0, default)
-                    entry.pack(fill=tk.X, ipady=3)
-                    entry_widget = entry
-            else:
-                entry = tk.Entry(
-                    f_frame, bg=ModernStyle.BG_INPUT,
-                    fg=ModernStyle.TEXT_PRIMARY, relief=tk.FLAT,
-                    font=('Segoe UI', 9)
-                )
-                entry.insert(0, default)
-                entry.pack(fill=tk.X, ipady=3)
-                entry_widget = entry
-            self.excel_config_entries[field] = entry_widget
+        self.excel_settings_form = SettingsForm(
+            card3,
+            [('SATZART', 'D'), ('FIRMA', '9241'), ('SOLL_HABEN', 'S'),
+             ('BUCH_KREIS', 'RE'), ('BUCH_JAHR', '2025'), ('BUCH_MONAT', '11'),
+             ('Bebuchbar', 'Ja')]
+        )
+        self.excel_settings_form.pack(fill=tk.X)
         
         # Transform button
         card4 = tk.Frame(parent, bg=ModernStyle.BG_CARD, padx=15, pady=15)
@@ -562,6 +656,7 @@ class MultiProjectApp:
             'BUCH_TEXT', 'HABENKONTO', 'KOSTSTELLE', 'KOSTTRAGER', 
             'Kostenträgerbezeichnung', 'Bebuchbar'
         ]
+        self._columns_tuple = tuple(self.columns)
         
         self.tree = EditableTreeview(tree_frame, columns=self.columns, show='headings',
                                     yscrollcommand=vsb.set, xscrollcommand=hsb.set)
@@ -571,12 +666,7 @@ class MultiProjectApp:
         
         for col in self.columns:
             self.tree.heading(col, text=col)
-            width = 100
-            if col in ['BUCH_TEXT', 'Kostenträgerbezeichnung']:
-                width = 250
-            if col in ['SATZART', 'SOLL_HABEN', 'BUCH_MONAT']:
-                width = 60
-            self.tree.column(col, width=width, minwidth=60, stretch=False)
+            self.tree.column(col, width=self._COLUMN_WIDTHS.get(col, 100), minwidth=60, stretch=False)
             
         self.tree.grid(row=0, column=0, sticky='nsew')
         vsb.grid(row=0, column=1, sticky='ns')
@@ -625,71 +715,13 @@ class MultiProjectApp:
         card2.pack(fill=tk.X, pady=(0, 15))
         ttk.Label(card2, text="2. Einstellungen (Standard)", style='Header.TLabel').pack(anchor=tk.W, pady=(0, 8))
 
-        self.ocr_config_entries = {}
-        fields = [ ('SATZART','D'), ('FIRMA','9251'), ('SOLL_HABEN','H'), ('BUCH_KREIS','RA'), ('HABENKONTO','42200') ]
-        for field, default in fields:
-            f_frame = tk.Frame(card2, bg=ModernStyle.BG_CARD, pady=3)
-            f_frame.pack(fill=tk.X, padx=5)
-            tk.Label(f_frame, text=field, bg=ModernStyle.BG_CARD, fg=ModernStyle.TEXT_SECONDARY, font=('Segoe UI', 9)).pack(anchor=tk.W)
-            
-            # Use Combobox for FIRMA
-            if field == 'FIRMA':
-                firma_var = tk.StringVar(value=default)
-                try:
-                    options = []
-                    if (
-                        self.mapping_data is not None and
-                        'FIRMA' in self.mapping_data.columns
-                    ):
-                        options = sorted(
-                            set(
-                                self.mapping_data['FIRMA']
-                                .astype(str).str.strip()
-                            )
-                        )
-                    else:
-                        try:
-                            from pathlib import Path
-                            alt_path = Path('kostentreäger_info_3.xlsx')
-                            if alt_path.exists():
-                                import pandas as pd
-                                alt_df = pd.read_excel(alt_path)
-                                if 'FIRMA' in alt_df.columns:
-                                    options = sorted(
-                                        set(
-                                            alt_df['FIRMA']
-                                            .astype(str).str.strip()
-                                        )
-                                    )
-                        except Exception:
-                            pass
-                    combo_state = 'readonly' if options else 'normal'
-                    combo = ttk.Combobox(
-                        f_frame, textvariable=firma_var,
-                        values=options, state=combo_state,
-                        font=('Segoe UI', 9)
-                    )
-                    combo.pack(fill=tk.X, ipady=0)
-                    entry_widget = combo
-                except Exception:
-                    entry = tk.Entry(
-                        f_frame, bg=ModernStyle.BG_INPUT,
-                        fg=ModernStyle.TEXT_PRIMARY, relief=tk.FLAT,
-                        font=('Segoe UI', 9)
-                    )
-                    entry.insert(0, default)
-                    entry.pack(fill=tk.X, ipady=3)
-                    entry_widget = entry
-            else:
-                entry = tk.Entry(
-                    f_frame, bg=ModernStyle.BG_INPUT,
-                    fg=ModernStyle.TEXT_PRIMARY, relief=tk.FLAT,
-                    font=('Segoe UI', 9)
-                )
-                entry.insert(0, default)
-                entry.pack(fill=tk.X, ipady=3)
-                entry_widget = entry
-            self.ocr_config_entries[field] = entry_widget
+        self.ocr_settings_form = SettingsForm(
+            card2,
+            [('SATZART', 'D'), ('FIRMA', '9251'), ('SOLL_HABEN', 'H'),
+             ('BUCH_KREIS', 'RA'), ('HABENKONTO', '42200')],
+            free_text_firma=True
+        )
+        self.ocr_settings_form.pack(fill=tk.X, padx=5)
 
         # Apply settings button
         ttk.Button(card2, text="✓ Einstellungen anwenden", style='Primary.TButton', command=self.apply_ocr_settings).pack(fill=tk.X, pady=(10, 0))
@@ -704,23 +736,91 @@ class MultiProjectApp:
     def select_pdf(self):
         filename = filedialog.askopenfilename(title="PDF auswählen", filetypes=[("PDF", "*.pdf")])
         if filename:
-            self.pdf_path = filename
+            self.pdf_paths = [filename]
             self.pdf_file_label.config(text=f"✅ {Path(filename).name}", fg=ModernStyle.SUCCESS)
             self.pdf_extract_btn.config(state=tk.NORMAL)
             self.pdf_status_label.config(text="✅ Bereit zum Extrahieren", fg=ModernStyle.SUCCESS)
 
+    def select_pdf_folder(self):
+        """Select a folder; every PDF below it is extracted as its own pool task."""
+        folder = filedialog.askdirectory(title="PDF-Ordner auswählen")
+        if not folder:
+            return
+        paths = sorted(
+            str(p) for p in Path(folder).rglob("*")
+            if p.suffix.lower() == ".pdf" and p.is_file()
+        )
+        if not paths:
+            messagebox.showerror("Fehler", "Keine PDF-Dateien im Ordner gefunden.")
+            return
+        self.pdf_paths = paths
+        self.pdf_file_label.config(text=f"✅ {Path(folder).name} ({len(paths)} PDF-Dateien)", fg=ModernStyle.SUCCESS)
+        self.pdf_extract_btn.config(state=tk.NORMAL)
+        self.pdf_status_label.config(text="✅ Bereit zum Extrahieren", fg=ModernStyle.SUCCESS)
+
     def extract_pdf_data(self):
-        if not self.pdf_path: return
-        self.pdf_status_label.config(text="⏳ Extrahiere...", fg=ModernStyle.TEXT_SECONDARY)
+        if not self.pdf_paths: return
+        # Results are collected per file index so the rows keep file order
+        # regardless of which worker finishes first
+        batch = {
+            'paths': list(self.pdf_paths),
+            'results': [None] * len(self.pdf_paths),
+            'remaining': 0,
+            'errors': [],
+        }
+        misses = []
+        for index, path in enumerate(batch['paths']):
+            cache_path = self._extraction_cache_path('pdf', path)
+            cached = self._load_cached_extraction(cache_path)
+            if cached is not None:
+                batch['results'][index] = cached
+            else:
+                misses.append((index, path, cache_path))
+        if not misses:
+            self._finish_pdf_batch(batch)
+            return
+        
+        batch['remaining'] = len(misses)
+        self._show_pdf_batch_progress(batch)
         self.pdf_extract_btn.config(state=tk.DISABLED)
-        threading.Thread(target=self._extract_pdf_thread).start()
+        from pdf_extractor import extract_invoices
+        for index, path, cache_path in misses:
+            self._submit(
+                partial(self._on_pdf_extracted, batch=batch, index=index, cache_path=cache_path),
+                extract_invoices, path
+            )
 
-    def _extract_pdf_thread(self):
+    def _on_pdf_extracted(self, future, batch, index, cache_path=None):
         try:
-            self.raw_pdf_data = extract_invoices(self.pdf_path)
-            self.root.after(0, self._pdf_extraction_complete)
+            result = future.result()
         except Exception as e:
-            self.root.after(0, lambda: messagebox.showerror("Fehler", str(e)))
+            batch['errors'].append(f"{Path(batch['paths'][index]).name}: {e}")
+            result = []
+        else:
+            self._store_cached_extraction(cache_path, result)
+        batch['results'][index] = result
+        batch['remaining'] -= 1
+        if batch['remaining']:
+            self._show_pdf_batch_progress(batch)
+            return
+        self._finish_pdf_batch(batch)
+
+    def _show_pdf_batch_progress(self, batch):
+        total = len(batch['paths'])
+        text = "⏳ Extrahiere..."
+        if total > 1:
+            text += f" ({total - batch['remaining']}/{total} Dateien)"
+        self.pdf_status_label.config(text=text, fg=ModernStyle.TEXT_SECONDARY)
+
+    def _finish_pdf_batch(self, batch):
+        if batch['errors']:
+            messagebox.showerror("Fehler", "\n".join(batch['errors']))
+            if len(batch['errors']) == len(batch['paths']):
+                self.pdf_status_label.config(text="Fehler bei der Extraktion", fg='#f15e64')
+                self.pdf_extract_btn.config(state=tk.NORMAL)
+                return
+        self.raw_pdf_data = [row for result in batch['results'] for row in result]
+        self._pdf_extraction_complete()
 
     def _pdf_extraction_complete(self):
         self.pdf_status_label.config(text=f"✅ Erfolgreich: {len(self.raw_pdf_data)} Rechnungseinträge extrahiert", fg=ModernStyle.SUCCESS)
@@ -750,16 +850,17 @@ class MultiProjectApp:
             messagebox.showerror("Fehler", "extracted_invoices.xlsx nicht gefunden.")
             return
         try:
-            df = pd.read_excel(extracted_file)
+            df = _read_excel_fast(extracted_file)
+            now = datetime.now().isoformat(timespec='seconds')
             extraction_log = {
                 'filename': extracted_file.name,
                 'filepath': str(extracted_file),
                 'total_pages': len(df),
-                'start_time': pd.Timestamp.now().isoformat(),
+                'start_time': now,
                 'status': 'completed',
                 'pages_completed': len(df),
                 'errors': [],
-                'end_time': pd.Timestamp.now().isoformat(),
+                'end_time': now,
                 'output_file': str(extracted_file)
             }
             self.raw_ocr_data = (extraction_log, df)
@@ -773,34 +874,67 @@ class MultiProjectApp:
     def extract_ocr_data(self):
         if not getattr(self, 'ocr_path', None):
             return
+        cache_path = self._extraction_cache_path('ocr', self.ocr_path)
+        cached = self._load_cached_extraction(cache_path)
+        if cached is not None:
+            self.raw_ocr_data = cached
+            self._ocr_extraction_complete()
+            return
         self.ocr_status_label.config(text="⏳ OCR läuft...", fg=ModernStyle.TEXT_SECONDARY)
         self.ocr_progress['value'] = 0
         self.ocr_progress_label.config(text="Starte OCR...")
         self.ocr_extract_btn.config(state=tk.DISABLED)
-        threading.Thread(target=self._extract_ocr_thread).start()
+        if self._ocr_progress_queue is None:
+            # Manager queues can be handed to pool workers, plain ones cannot
+            self._ocr_manager = multiprocessing.Manager()
+            self._ocr_progress_queue = self._ocr_manager.Queue()
+        self._submit(
+            partial(self._on_ocr_extracted, cache_path=cache_path),
+            _run_ocr_extraction, self.ocr_path, self._ocr_progress_queue
+        )
 
-    def _extract_ocr_thread(self):
+    def _on_ocr_extracted(self, future, cache_path=None):
+        self._drain_ocr_progress()
         try:
-            # Run OCR extraction on the selected PDF
-            try:
-                from ocr_analysis.poppler_extractor import PopperExtractor
-            except Exception as ie:
-                self.root.after(0, lambda: messagebox.showerror("Fehler", f"OCR dependencies missing or import failed: {ie}"))
-                self.root.after(0, lambda: self.ocr_status_label.config(text="Fehler beim Starten von OCR", fg='#f15e64'))
-                return
-
-            extractor = PopperExtractor()
-            extraction_log, df = extractor.extract_pdf(self.ocr_path, output_folder='temp_analysis', 
-                                                       progress_callback=self._update_ocr_progress)
-            self.raw_ocr_data = (extraction_log, df)
-            self.root.after(0, self._ocr_extraction_complete)
+            self.raw_ocr_data = future.result()
+        except ImportError as ie:
+            messagebox.showerror("Fehler", str(ie))
+            self.ocr_status_label.config(text="Fehler beim Starten von OCR", fg='#f15e64')
+            return
         except Exception as e:
-            self.root.after(0, lambda: messagebox.showerror("Fehler", str(e)))
+            messagebox.showerror("Fehler", str(e))
+            return
+        log, df = self.raw_ocr_data
+        if df is not None:
+            # Failed runs return no frame and are retried next time
+            self._store_cached_extraction(cache_path, self.raw_ocr_data)
+        self._ocr_extraction_complete()
+
+    def _drain_ocr_progress(self):
+        if self._ocr_progress_queue is None:
+            return
+        while True:
+            try:
+                current, total, elapsed_time = self._ocr_progress_queue.get_nowait()
+            except queue.Empty:
+                break
+            self._update_ocr_progress(current, total, elapsed_time)
 
     def _update_ocr_progress(self, current, total, elapsed_time):
-        """Update progress bar during OCR extraction"""
+        """Record OCR progress; the widgets are refreshed by _flush_ocr_progress"""
+        self._ocr_progress_state = (current, total, elapsed_time)
+        if not self._ocr_progress_scheduled:
+            self._ocr_progress_scheduled = True
+            self.root.after(33, self._flush_ocr_progress)
+
+    def _flush_ocr_progress(self):
+        """Update progress bar from the latest recorded OCR progress"""
+        self._ocr_progress_scheduled = False
+        if self._ocr_progress_state is None:
+            return
+        current, total, elapsed_time = self._ocr_progress_state
         percentage = int((current / total) * 100) if total > 0 else 0
-        self.root.after(0, lambda: self.ocr_progress.config(value=percentage))
+        self.ocr_progress.config(value=percentage)
         
         # Estimate remaining time
         if current > 0 and elapsed_time > 0:
@@ -817,7 +951,7 @@ class MultiProjectApp:
         else:
             progress_text = f"{percentage}% ({current}/{total} Seiten)"
         
-        self.root.after(0, lambda: self.ocr_progress_label.config(text=progress_text))
+        self.ocr_progress_label.config(text=progress_text)
 
     def _ocr_extraction_complete(self):
         if getattr(self, 'raw_ocr_data', None) is None:
@@ -825,6 +959,8 @@ class MultiProjectApp:
             self.ocr_extract_btn.config(state=tk.NORMAL)
             return
 
+        # Drop any progress still waiting to be flushed over the final state
+        self._ocr_progress_state = None
         log, df = self.raw_ocr_data
         pages = log.get('pages_completed', 0) if isinstance(log, dict) else (len(df) if df is not None else 0)
         self.ocr_progress['value'] = 100
@@ -836,6 +972,7 @@ class MultiProjectApp:
 
     def apply_ocr_settings(self):
         """Apply OCR settings with field validation"""
+        import pandas as pd
         if not getattr(self, 'raw_ocr_data', None):
             return
 
@@ -847,9 +984,7 @@ class MultiProjectApp:
             )
             return
 
-        defaults = {
-            k: v.get() for k, v in self.ocr_config_entries.items()
-        }
+        defaults = self.ocr_config_entries
 
         # Import validator
         try:
@@ -857,175 +992,70 @@ class MultiProjectApp:
         except ImportError:
             FieldValidator = None
 
-        self.processed_data = []
-        
-        for idx, row_data in df.iterrows():
-            # Extract invoice number from OCR data
-            inv_num = str(
-                row_data.get('Invoice Number', '')
-            ).strip()
-            
-            # Date parsing (DD.MM.YYYY to YYYYMMDD)
-            date_str = str(row_data.get('Date', '')).strip()
-            beleg_dat = ''
-            buch_jahr = ''
-            buch_monat = ''
-            
-            if date_str and date_str != '':
-                try:
-                    dt = pd.to_datetime(
-                        date_str,
-                        dayfirst=True,
-                        errors='coerce'
-                    )
-                    if not pd.isna(dt):
-                        beleg_dat = dt.strftime('%Y%m%d')
-                        buch_jahr = dt.year
-                        buch_monat = dt.month
-                except Exception:
-                    pass
+        # Build all rows column-wise; only enrichment and validation stay per row
+        df = df.reset_index(drop=True)
+        
+        def text(col):
+            # str() per cell like the old row loop, so values render identically
+            if col not in df.columns:
+                return pd.Series('', index=df.index, dtype=object)
+            return df[col].map(str).str.strip()
 
-            # Convert amount: "1.234,56" → 123456 cents
-            def euros_to_cents(val):
-                if val is None or val == '':
-                    return None
-                try:
-                    s = str(val).strip()
-                    if s == '':
-                        return None
-                    
-                    # Check if already a large number (likely cents)
-                    # Pattern: no comma, large value (>1000)
-                    try:
-                        num = float(s.replace(',', '.'))
-                        # If >1000 and no comma separator, assume cents
-                        if num > 1000 and ',' not in s:
-                            return int(round(num))
-                    except Exception:
-                        pass
-                    
-                    # Convert from euros: 1.234,56 -> 123456 cents
-                    parts = s.split(',')
-                    if len(parts) == 2:
-                        whole, frac = parts
-                        whole = whole.replace('.', '')
-                        s = f"{whole}.{frac}"
-                    else:
-                        s = s.replace(',', '.')
-                    return int(round(float(s) * 100))
-                except Exception:
-                    return None
-
-            betrag = euros_to_cents(
-                row_data.get('Line Total')
-            )
-            if betrag is None:
-                betrag = euros_to_cents(
-                    row_data.get('Total Amount')
-                )
-
-            # Extract customer/debitor number
-            # Priority: Customer Number field, then invoice suffix
-            debi_kredi = str(
-                row_data.get('Customer Number', '')
-            ).strip()
-            
-            if not debi_kredi:
-                # Fallback to invoice suffix (number after /)
-                invoice_suffix = str(
-                    row_data.get('Invoice Suffix', '')
-                ).strip()
-                if invoice_suffix:
-                    debi_kredi = invoice_suffix
-            
-            # Build booking text
-            recipient = str(
-                row_data.get('Recipient Name', '')
-            ).strip()
-            description = str(
-                row_data.get('Description', '')
-            ).strip()[:100]
-            
-            buch_text = f"{recipient} {description}".strip()
-
-            row = {
-                'SATZART': defaults.get('SATZART', 'D'),
-                'FIRMA': defaults.get('FIRMA', ''),
-                'BELEG_NR': inv_num,
-                'BELEG_DAT': beleg_dat,
-                'SOLL_HABEN': defaults.get('SOLL_HABEN', ''),
-                'BUCH_KREIS': defaults.get('BUCH_KREIS', ''),
-                'BUCH_JAHR': buch_jahr,
-                'BUCH_MONAT': buch_monat,
-                'DEBI_KREDI': debi_kredi,
-                'BETRAG': (
-                    betrag if betrag is not None else ''
-                ),
-                'RECHNUNG': inv_num or '',
-                'BUCH_TEXT': buch_text,
-                'HABENKONTO': defaults.get('HABENKONTO', ''),
-                'KOSTSTELLE': '',
-                'KOSTTRAGER': '',
-                'Kostenträgerbezeichnung': '',
-                'Bebuchbar': 'Ja',
-                'ocr_confidence': row_data.get(
-                    'ocr_confidence', 0.0
-                ),
-                'validation_required': row_data.get(
-                    'validation_required', False
-                )
-            }
+        def column(col, default):
+            return df[col] if col in df.columns else pd.Series(default, index=df.index, dtype=object)
 
+        inv_num = text('Invoice Number')
+        
+        # Date parsing (DD.MM.YYYY to YYYYMMDD)
+        dates = pd.to_datetime(
+            text('Date'), dayfirst=True, errors='coerce', format='mixed'
+        )
+        beleg_dat, buch_jahr, buch_monat = _date_parts(dates)
+        
+        # Convert amount: "1.234,56" → 123456 cents, Total Amount as fallback
+        betrag = _euros_to_cents(column('Line Total', None)).fillna(
+            _euros_to_cents(column('Total Amount', None))
+        )
+        betrag = betrag.astype(object).where(betrag.notna(), '')
+        
+        # Extract customer/debitor number
+        # Priority: Customer Number field, then invoice suffix (number after /)
+        debi_kredi = text('Customer Number')
+        debi_kredi = debi_kredi.where(debi_kredi != '', text('Invoice Suffix'))
+        
+        # Build booking text
+        buch_text = (
+            text('Recipient Name') + ' ' + text('Description').str[:100]
+        ).str.strip()
+        
+        out = pd.DataFrame({
+            'SATZART': defaults.get('SATZART', 'D'),
+            'FIRMA': defaults.get('FIRMA', ''),
+            'BELEG_NR': inv_num,
+            'BELEG_DAT': beleg_dat,
+            'SOLL_HABEN': defaults.get('SOLL_HABEN', ''),
+            'BUCH_KREIS': defaults.get('BUCH_KREIS', ''),
+            'BUCH_JAHR': buch_jahr,
+            'BUCH_MONAT': buch_monat,
+            'DEBI_KREDI': debi_kredi,
+            'BETRAG': betrag,
+            'RECHNUNG': inv_num,
+            'BUCH_TEXT': buch_text,
+            'HABENKONTO': defaults.get('HABENKONTO', ''),
+            'KOSTSTELLE': '',
+            'KOSTTRAGER': '',
+            'Kostenträgerbezeichnung': '',
+            'Bebuchbar': 'Ja',
+            'ocr_confidence': column('ocr_confidence', 0.0),
+            'validation_required': column('validation_required', False),
+        }, index=df.index)
+        
+        self.processed_data = out.to_dict('records')
+        
+        firma_val = str(defaults.get('FIRMA', '')).strip()
+        for row in self.processed_data:
             # Enrich / correct DEBI_KREDI using extended mapping if missing or shortened
-            try:
-                if self.extended_mapping is not None:
-                    debi_val = str(row.get('DEBI_KREDI', '')).strip()
-                    firma_val = str(defaults.get('FIRMA', '')).strip()
-                    matched_row = None
-                    # Criteria: empty debi OR numeric too short (< 7) OR suffix match exists in extended mapping
-                    if (not debi_val) or (len(debi_val) < 7):
-                        cand = self.extended_mapping
-                        if firma_val and 'FIRMA' in cand.columns:
-                            cand = cand[cand['FIRMA'] == firma_val]
-                        # Try exact Kostenträger match (remove leading zero if added)
-                        raw_kost = str(row.get('KOSTTRAGER', '')).lstrip('0')
-                        k_match = cand[cand['Kostenträger'].str.lstrip('0') == raw_kost]
-                        if not k_match.empty:
-                            matched_row = k_match.iloc[0]
-                            row['DEBI_KREDI'] = matched_row['DEBI_KREDI']
-                        else:
-                            # Fallback: any DEBI_KREDI ending with current debi_val
-                            if debi_val:
-                                suf = cand[cand['DEBI_KREDI'].str.endswith(debi_val)]
-                                if not suf.empty:
-                                    matched_row = suf.iloc[0]
-                                    row['DEBI_KREDI'] = matched_row['DEBI_KREDI']
-                    else:
-                        # If we have a short value that is suffix of a longer one, replace
-                        cand = self.extended_mapping
-                        if firma_val and 'FIRMA' in cand.columns:
-                            cand = cand[cand['FIRMA'] == firma_val]
-                        suf = cand[cand['DEBI_KREDI'].str.endswith(debi_val)]
-                        if not suf.empty and suf.iloc[0]['DEBI_KREDI'] != debi_val:
-                            matched_row = suf.iloc[0]
-                            row['DEBI_KREDI'] = matched_row['DEBI_KREDI']
-                    
-                    # After enriching DEBI_KREDI, also fill cost center fields from matched row
-                    if matched_row is not None:
-                        if 'Kostenträger' in matched_row:
-                            kosttrager_from_ext = str(matched_row['Kostenträger'])
-                            if kosttrager_from_ext and not kosttrager_from_ext.startswith('0'):
-                                kosttrager_from_ext = '0' + kosttrager_from_ext
-                            row['KOSTTRAGER'] = kosttrager_from_ext
-                            
-                            if len(kosttrager_from_ext) >= 4:
-                                row['KOSTSTELLE'] = kosttrager_from_ext[:4]
-                        
-                        bez_col = 'Kostenträgerbezeichnung' if 'Kostenträgerbezeichnung' in matched_row else 'Kostenträger Bezeichnung'
-                        if bez_col in matched_row:
-                            row['Kostenträgerbezeichnung'] = str(matched_row[bez_col])
-            except Exception:
-                pass
+            self._enrich_from_extended(row, firma_val)
 
             # Run validation if available
             if FieldValidator:
@@ -1042,22 +1072,8 @@ class MultiProjectApp:
                 if has_invalid:
                     row['validation_required'] = True
 
-            self.processed_data.append(row)
-
-        # Update grid with color coding
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-
-        for row in self.processed_data:
-            values = [row.get(col, '') for col in self.columns]
-            item_id = self.tree.insert('', tk.END, values=values)
-            
-            # Tag rows needing validation
-            if row.get('validation_required', False):
-                self.tree.item(
-                    item_id,
-                    tags=('needs_validation',)
-                )
+        # Update grid with color coding (rows needing validation are tagged)
+        self._populate_tree(self.processed_data)
         
         # Configure tags for visual feedback
         self.tree.tag_configure(
@@ -1070,79 +1086,177 @@ class MultiProjectApp:
         filename = filedialog.askopenfilename(title="Mapping-Datei", filetypes=[("Excel", "*.xlsx")])
         if not filename: return
         
-        try:
-            df = pd.read_excel(filename)
-            column_map = {
-                'Personenkonto': 'Kundennummer',
-                'Kostt Hellern 2025': 'Kostenträger',
-                'Kostenträger Bezeichnung': 'Kostenträgerbezeichnung'
-            }
-            df = df.rename(columns=column_map)
-            
-            required = ['Kundennummer', 'Kostenträger', 'Kostenträgerbezeichnung']
-            missing = [col for col in required if col not in df.columns]
-            
-            if missing:
-                messagebox.showerror("Fehler", f"Fehlende Spalten: {', '.join(missing)}")
-                return
-                
-            df = df[required]
-            df.to_excel(self.mapping_file_path, index=False)
-            self.load_stored_mapping()
-            messagebox.showinfo("Erfolg", "Datenbank aktualisiert!")
+        self.pdf_mapping_btn.config(state=tk.DISABLED)
+        self.pdf_mapping_status.config(text="⏳ Datenbank wird importiert...", fg=ModernStyle.TEXT_SECONDARY)
+        self._submit_io(self._on_mapping_uploaded, self._store_uploaded_mapping, filename)
+
+    def _store_uploaded_mapping(self, filename):
+        """Validate an uploaded mapping workbook and save it as the mapping DB (I/O thread)."""
+        df = _read_excel_fast(filename)
+        column_map = {
+            'Personenkonto': 'Kundennummer',
+            'Kostt Hellern 2025': 'Kostenträger',
+            'Kostenträger Bezeichnung': 'Kostenträgerbezeichnung'
+        }
+        df = df.rename(columns=column_map)
+        
+        required = ['Kundennummer', 'Kostenträger', 'Kostenträgerbezeichnung']
+        missing = [col for col in required if col not in df.columns]
+        
+        if missing:
+            raise ValueError(f"Fehlende Spalten: {', '.join(missing)}")
             
+        df = df[required]
+        # Write next to the DB and swap it in, so an interrupted save
+        # never leaves a truncated mapping_db.xlsx behind
+        tmp_path = self.mapping_file_path.with_name(self.mapping_file_path.stem + ".tmp.xlsx")
+        try:
+            df.to_excel(tmp_path, index=False)
+            os.replace(tmp_path, self.mapping_file_path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+        # Parquet copy for the reload that follows, and no copies of
+        # earlier workbooks
+        cache_path = self._write_mapping_cache(df)
+        stem = self.mapping_file_path.stem
+        for old in self.mapping_file_path.parent.glob(f"{stem}.*parquet"):
+            if old != cache_path:
+                try:
+                    old.unlink()
+                except OSError:
+                    pass
+
+    def _on_mapping_uploaded(self, future):
+        self.pdf_mapping_btn.config(state=tk.NORMAL)
+        # Reload in either case; it also resets the "importiert" status
+        self.load_stored_mapping()
+        try:
+            future.result()
         except Exception as e:
             messagebox.showerror("Fehler", str(e))
+            return
+        messagebox.showinfo("Erfolg", "Datenbank aktualisiert!")
+
+    def _mapping_cache_path(self):
+        """Parquet copy of mapping_db.xlsx; the name records the workbook's
+        mtime and size, so a replaced workbook (even an older-dated one)
+        never matches a stale copy."""
+        st = self.mapping_file_path.stat()
+        return self.mapping_file_path.with_name(
+            f"{self.mapping_file_path.stem}.{st.st_mtime_ns}-{st.st_size}.parquet"
+        )
+
+    def _write_mapping_cache(self, df):
+        """Save df as the parquet copy of the current workbook; returns its path.
+
+        pyarrow is optional; without it (or for column types parquet cannot
+        hold) nothing is written and every load reads the workbook.
+        """
+        cache_path = self._mapping_cache_path()
+        tmp_path = cache_path.with_suffix(".tmp")
+        try:
+            df.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, cache_path)
+        except Exception:
+            pass
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+        return cache_path
+
+    def _read_mapping_file(self):
+        """Read mapping_db.xlsx, via its parquet copy if present."""
+        import pandas as pd
+        try:
+            return pd.read_parquet(self._mapping_cache_path())
+        except Exception:
+            pass
+        df = _read_excel_fast(self.mapping_file_path)
+        # A workbook not saved through the upload has no copy yet
+        self._write_mapping_cache(df)
+        return df
 
     def load_stored_mapping(self):
+        self._mapping_load_generation += 1
         if self.mapping_file_path.exists():
-            try:
-                df = pd.read_excel(self.mapping_file_path)
-                # Normalize columns to expected names
-                col_map = {
-                    'Kundennummer': 'DEBI_KREDI',
-                    'Personenkonto': 'DEBI_KREDI',
-                    'Kostenträgerbezeichnung': 'Kostenträger Bezeichnung',
-                }
-                df = df.rename(columns=col_map)
-                # Ensure key columns exist
-                # Support both old and new schema
-                for needed in ['DEBI_KREDI', 'Kostenträger']:
-                    if needed not in df.columns:
-                        raise ValueError(f"Spalte fehlt: {needed}")
-                # Clean data types
-                df['DEBI_KREDI'] = (
-                    df['DEBI_KREDI'].astype(str).str.replace(' ', '')
-                )
-                if 'FIRMA' in df.columns:
-                    df['FIRMA'] = df['FIRMA'].astype(str).str.strip()
-                if 'Kostenträger Bezeichnung' in df.columns:
-                    df['Kostenträger Bezeichnung'] = (
-                        df['Kostenträger Bezeichnung'].astype(str)
-                    )
-                self.mapping_data = df
-                self.pdf_mapping_status.config(
-                    text=f"✅ Datenbank geladen ({len(df)} Einträge)",
-                    fg=ModernStyle.SUCCESS
-                )
-            except Exception as e:
-                self.pdf_mapping_status.config(
-                    text=f"❌ Fehler: {e}",
-                    fg='#f15e64'
-                )
+            mtime = self.mapping_file_path.stat().st_mtime_ns
+            if self.mapping_data is not None and mtime == self._mapping_mtime:
+                # Unchanged since the last load
+                self._show_mapping_loaded()
+                return
+            self.pdf_mapping_status.config(
+                text="⏳ Datenbank wird geladen...",
+                fg=ModernStyle.TEXT_SECONDARY
+            )
+            self._submit_io(
+                partial(self._on_mapping_loaded, mtime=mtime,
+                        generation=self._mapping_load_generation),
+                self._read_stored_mapping
+            )
         else:
             self.pdf_mapping_status.config(
                 text="Keine Datenbank",
                 fg=ModernStyle.TEXT_SECONDARY
             )
 
+    def _read_stored_mapping(self):
+        """Read and normalise the mapping DB (I/O thread)."""
+        df = self._read_mapping_file()
+        # Normalize columns to expected names
+        col_map = {
+            'Kundennummer': 'DEBI_KREDI',
+            'Personenkonto': 'DEBI_KREDI',
+            'Kostenträgerbezeichnung': 'Kostenträger Bezeichnung',
+        }
+        df = df.rename(columns=col_map)
+        # Ensure key columns exist
+        # Support both old and new schema
+        for needed in ['DEBI_KREDI', 'Kostenträger']:
+            if needed not in df.columns:
+                raise ValueError(f"Spalte fehlt: {needed}")
+        # Clean data types
+        df['DEBI_KREDI'] = (
+            df['DEBI_KREDI'].astype(str).str.replace(' ', '')
+        )
+        if 'FIRMA' in df.columns:
+            df['FIRMA'] = df['FIRMA'].astype(str).str.strip()
+        if 'Kostenträger Bezeichnung' in df.columns:
+            df['Kostenträger Bezeichnung'] = (
+                df['Kostenträger Bezeichnung'].astype(str)
+            )
+        return df
+
+    def _on_mapping_loaded(self, future, mtime, generation):
+        if generation != self._mapping_load_generation:
+            # A later load_stored_mapping call superseded this read
+            return
+        try:
+            df = future.result()
+        except Exception as e:
+            self.pdf_mapping_status.config(
+                text=f"❌ Fehler: {e}",
+                fg='#f15e64'
+            )
+            return
+        self.mapping_data = df
+        self._mapping_mtime = mtime
+        self._build_mapping_index()
+        self._show_mapping_loaded()
+
+    def _show_mapping_loaded(self):
+        self.pdf_mapping_status.config(
+            text=f"✅ Datenbank geladen ({len(self.mapping_data)} Einträge)",
+            fg=ModernStyle.SUCCESS
+        )
+
     def load_extended_mapping(self):
         """Load extended mapping file (kostentreäger_info_3.xlsx) if present for DEBI_KREDI enrichment."""
         try:
             ext_path = Path('kostentreäger_info_3.xlsx')
             if not ext_path.exists():
                 return
-            df = pd.read_excel(ext_path)
+            df = _read_excel_fast(ext_path)
             # Basic column normalization
             rename_map = {
                 'Kostenträger Bezeichnung': 'Kostenträgerbezeichnung'
@@ -1163,178 +1277,226 @@ class MultiProjectApp:
             self.extended_mapping = None
 
     def apply_pdf_settings(self):
+        import pandas as pd
         if not self.raw_pdf_data:
             return
         
-        settings = {k: v.get() for k, v in self.pdf_config_entries.items()}
+        settings = self.pdf_config_entries
         buch_text_template = self.pdf_buch_text_entry.get()
         
-        self.processed_data = []
+        # Build the whole batch column-wise instead of one dict per invoice
+        # (item.get per field, so a key missing from one invoice reads as '')
+        fields = {
+            'invoice_number': '', 'invoice_date': '', 'customer_number': '',
+            'student_name': '', 'subject': '', 'school': '', 'month_year': '',
+            'amount': 0,
+        }
+        raw = pd.DataFrame({
+            col: [item.get(col, default) for item in self.raw_pdf_data]
+            for col, default in fields.items()
+        }, dtype=object)
+        
+        out = pd.DataFrame(index=raw.index)
+        for col in (
+            'SATZART', 'FIRMA', 'SOLL_HABEN', 'BUCH_KREIS',
+            'HABENKONTO', 'Bebuchbar',
+        ):
+            out[col] = settings[col]
+        
+        dates = pd.to_datetime(
+            raw['invoice_date'], dayfirst=True, errors='coerce',
+            format='mixed'
+        )
+        out['BELEG_DAT'], out['BUCH_JAHR'], out['BUCH_MONAT'] = (
+            _date_parts(dates)
+        )
+        out['BELEG_NR'] = raw['invoice_number']
+        out['RECHNUNG'] = raw['invoice_number']
+        out['DEBI_KREDI'] = raw['customer_number']
+        out['BETRAG'] = (
+            pd.to_numeric(raw['amount'], errors='coerce')
+            .fillna(0).mul(100).astype('int64')
+        )
+        placeholders = [
+            field for _, field, _, _ in string.Formatter().parse(buch_text_template)
+            if field is not None
+        ]
+        if placeholders:
+            out['BUCH_TEXT'] = [
+                buch_text_template.format(
+                    student=student, subject=subject, school=school, month=month
+                )
+                for student, subject, school, month in zip(
+                    raw['student_name'], raw['subject'],
+                    raw['school'], raw['month_year']
+                )
+            ]
+        else:
+            # Constant text; format() only to unescape {{ }}
+            out['BUCH_TEXT'] = buch_text_template.format()
         
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-            
-        for item in self.raw_pdf_data:
-            beleg_dat = ""
-            buch_jahr = ""
-            buch_monat = ""
-            if item.get('invoice_date'):
-                try:
-                    date_obj = pd.to_datetime(
-                        item['invoice_date'], dayfirst=True
-                    )
-                    beleg_dat = date_obj.strftime('%Y%m%d')
-                    buch_jahr = date_obj.year
-                    buch_monat = date_obj.month
-                except Exception:
-                    pass
-                
-            betrag = int(item.get('amount', 0) * 100)
-            
-            buch_text = buch_text_template.format(
-                student=item.get('student_name', ''),
-                subject=item.get('subject', ''),
-                school=item.get('school', ''),
-                month=item.get('month_year', '')
-            )
-            
-            kosttrager = settings['KOSTTRAGER']
-            kost_bez = settings['Kostenträgerbezeichnung']
-
-            # New mapping: filter by FIRMA, then find closest DEBI_KREDI match
-            if self.mapping_data is not None:
-                firma_input = str(settings.get('FIRMA', '')).strip()
-                debi_kredi_extracted = str(
-                    item.get('customer_number', '')
-                ).replace(' ', '')
-                df = self.mapping_data.copy()
-                if firma_input and 'FIRMA' in df.columns:
-                    df = df[df['FIRMA'] == firma_input]
-                # Try exact match on DEBI_KREDI
-                exact = df[df['DEBI_KREDI'] == debi_kredi_extracted]
-                chosen = None
-                if not exact.empty:
-                    chosen = exact.iloc[0]
-                else:
-                    # If no exact, compute numeric distance for closest match
-                    try:
-                        target = int(
-                            ''.join(
-                                filter(
-                                    str.isdigit,
-                                    debi_kredi_extracted or '0'
-                                )
-                            )
-                        )
-                        df_num = df.assign(
-                            _num=df['DEBI_KREDI'].apply(
-                                lambda s: int(
-                                    ''.join(
-                                        filter(str.isdigit, str(s))
-                                    ) or 0
-                                )
-                            )
-                        )
-                        if not df_num.empty:
-                            df_num = df_num.assign(
-                                _dist=(df_num['_num'] - target).abs()
-                            )
-                            chosen = df_num.sort_values('_dist').iloc[0]
-                    except Exception:
-                        pass
-                if chosen is not None:
-                    # Support both label variants for description
-                    kosttrager = str(chosen['Kostenträger'])
-                    bez_col = (
-                        'Kostenträger Bezeichnung'
-                        if 'Kostenträger Bezeichnung' in df.columns
-                        else 'Kostenträgerbezeichnung'
-                    )
-                    kost_bez = str(chosen.get(bez_col, kost_bez))
-            
-            if kosttrager and not kosttrager.startswith('0'):
-                kosttrager = '0' + kosttrager
-                
-            koststelle = (
-                kosttrager[:4]
-                if kosttrager and len(kosttrager) >= 4
-                else settings['KOSTSTELLE']
-            )
-            
-            row = {
-                'SATZART': settings['SATZART'],
-                'FIRMA': settings['FIRMA'],
-                'BELEG_NR': item.get('invoice_number', ''),
-                'BELEG_DAT': beleg_dat,
-                'SOLL_HABEN': settings['SOLL_HABEN'],
-                'BUCH_KREIS': settings['BUCH_KREIS'],
-                'BUCH_JAHR': buch_jahr,
-                'BUCH_MONAT': buch_monat,
-                'DEBI_KREDI': item.get('customer_number', ''),
-                'BETRAG': betrag,
-                'RECHNUNG': item.get('invoice_number', ''),
-                'BUCH_TEXT': buch_text,
-                'HABENKONTO': settings['HABENKONTO'],
-                'KOSTSTELLE': koststelle,
-                'KOSTTRAGER': kosttrager,
-                'Kostenträgerbezeichnung': kost_bez,
-                'Bebuchbar': settings['Bebuchbar']
+        kosttrager = pd.Series(
+            settings['KOSTTRAGER'], index=raw.index, dtype=object
+        )
+        kost_bez = pd.Series(
+            settings['Kostenträgerbezeichnung'], index=raw.index, dtype=object
+        )
+        
+        # New mapping: filter by FIRMA, then find closest DEBI_KREDI match.
+        # Resolved once per distinct customer number, not once per row.
+        if self.mapping_data is not None:
+            firma_input = str(settings.get('FIRMA', '')).strip()
+            # pdf_extractor already strips the spaces from customer numbers
+            keys = raw['customer_number'].astype(str)
+            hits = {
+                key: self._match_mapping(key, firma_input)
+                for key in keys.unique()
             }
-
+            for key, idx in keys.groupby(keys, sort=False).groups.items():
+                hit = hits[key]
+                if hit is not None:
+                    kosttrager.loc[idx] = hit[0]
+                    if hit[1] is not None:
+                        kost_bez.loc[idx] = hit[1]
+        
+        needs_zero = kosttrager.str.len().gt(0) & ~kosttrager.str.startswith('0')
+        kosttrager = kosttrager.where(~needs_zero, '0' + kosttrager)
+        out['KOSTTRAGER'] = kosttrager
+        out['KOSTSTELLE'] = kosttrager.str[:4].where(
+            kosttrager.str.len().ge(4), settings['KOSTSTELLE']
+        )
+        out['Kostenträgerbezeichnung'] = kost_bez
+        
+        self.processed_data = out[self.columns].to_dict('records')
+        
+        for row in self.processed_data:
             # Enrich / correct DEBI_KREDI using extended mapping if missing or shortened
+            self._enrich_from_extended(row, str(row.get('FIRMA', '')).strip())
+        self._populate_tree(self.processed_data)
+
+    def _build_mapping_index(self):
+        """Index mapping_data for _match_mapping and the match preview.
+
+        For each FIRMA, and under None for all rows, keeps the first entry per
+        DEBI_KREDI plus the DEBI_KREDI numbers in sorted order for the
+        closest-number fallback. Entries are ``(position, kosttrager, bezeichnung)``.
+        """
+        self._mapping_index = {}
+        df = self.mapping_data
+        if df is None:
+            return
+        # Support both label variants for description
+        bez_col = (
+            'Kostenträger Bezeichnung'
+            if 'Kostenträger Bezeichnung' in df.columns
+            else 'Kostenträgerbezeichnung'
+        )
+        kost = df['Kostenträger'].map(str)
+        bez = df[bez_col].map(str) if bez_col in df.columns else [None] * len(df)
+        firmas = df['FIRMA'] if 'FIRMA' in df.columns else [None] * len(df)
+        
+        groups = {}
+        for pos, (debi, k, b, firma) in enumerate(zip(df['DEBI_KREDI'], kost, bez, firmas)):
+            entry = (pos, k, b)
+            num = int(''.join(filter(str.isdigit, str(debi))) or 0)
+            for key in {None, firma}:
+                exact, by_num = groups.setdefault(key, ({}, {}))
+                exact.setdefault(debi, entry)
+                by_num.setdefault(num, entry)
+        for key, (exact, by_num) in groups.items():
+            nums = sorted(by_num)
+            self._mapping_index[key] = (exact, nums, [by_num[n] for n in nums])
+
+    def _match_mapping(self, debi_kredi, firma_input):
+        """Find the mapping DB entry for a normalized DEBI_KREDI.
+
+        Filters by FIRMA first, then tries an exact match and falls back to the
+        numerically closest DEBI_KREDI. Returns ``(kosttrager, bezeichnung)``
+        or None; ``bezeichnung`` is None if the DB has no description column.
+        """
+        use_firma = firma_input and 'FIRMA' in self.mapping_data.columns
+        group = self._mapping_index.get(firma_input if use_firma else None)
+        if group is None:
+            return None
+        exact, nums, entries = group
+        # Try exact match on DEBI_KREDI
+        chosen = exact.get(debi_kredi)
+        if chosen is None:
+            # If no exact, take the closest number (earliest row on a tie)
             try:
-                if self.extended_mapping is not None:
-                    debi_val = str(row.get('DEBI_KREDI', '')).strip()
-                    firma_val = str(row.get('FIRMA', '')).strip()
-                    matched_row = None
-                    # Criteria: empty debi OR numeric too short (< 7) OR suffix match exists in extended mapping
-                    if (not debi_val) or (len(debi_val) < 7):
-                        cand = self.extended_mapping
-                        if firma_val and 'FIRMA' in cand.columns:
-                            cand = cand[cand['FIRMA'] == firma_val]
-                        # Try exact Kostenträger match (remove leading zero if added)
-                        raw_kost = str(row.get('KOSTTRAGER', '')).lstrip('0')
-                        k_match = cand[cand['Kostenträger'].str.lstrip('0') == raw_kost]
-                        if not k_match.empty:
-                            matched_row = k_match.iloc[0]
-                            row['DEBI_KREDI'] = matched_row['DEBI_KREDI']
-                        else:
-                            # Fallback: any DEBI_KREDI ending with current debi_val
-                            if debi_val:
-                                suf = cand[cand['DEBI_KREDI'].str.endswith(debi_val)]
-                                if not suf.empty:
-                                    matched_row = suf.iloc[0]
-                                    row['DEBI_KREDI'] = matched_row['DEBI_KREDI']
-                    else:
-                        # If we have a short value that is suffix of a longer one, replace
-                        cand = self.extended_mapping
-                        if firma_val and 'FIRMA' in cand.columns:
-                            cand = cand[cand['FIRMA'] == firma_val]
-                        suf = cand[cand['DEBI_KREDI'].str.endswith(debi_val)]
-                        if not suf.empty and suf.iloc[0]['DEBI_KREDI'] != debi_val:
-                            matched_row = suf.iloc[0]
-                            row['DEBI_KREDI'] = matched_row['DEBI_KREDI']
-                    
-                    # After enriching DEBI_KREDI, also fill cost center fields from matched row
-                    if matched_row is not None:
-                        if 'Kostenträger' in matched_row:
-                            kosttrager_from_ext = str(matched_row['Kostenträger'])
-                            if kosttrager_from_ext and not kosttrager_from_ext.startswith('0'):
-                                kosttrager_from_ext = '0' + kosttrager_from_ext
-                            row['KOSTTRAGER'] = kosttrager_from_ext
-                            
-                            if len(kosttrager_from_ext) >= 4:
-                                row['KOSTSTELLE'] = kosttrager_from_ext[:4]
-                        
-                        bez_col = 'Kostenträgerbezeichnung' if 'Kostenträgerbezeichnung' in matched_row else 'Kostenträger Bezeichnung'
-                        if bez_col in matched_row:
-                            row['Kostenträgerbezeichnung'] = str(matched_row[bez_col])
-            except Exception:
-                pass
+                target = int(
+                    ''.join(filter(str.isdigit, debi_kredi or '0'))
+                )
+            except (TypeError, ValueError):
+                return None
+            i = bisect_left(nums, target)
+            j = min(
+                (j for j in (i - 1, i) if 0 <= j < len(nums)),
+                key=lambda j: (abs(nums[j] - target), entries[j][0]),
+                default=None
+            )
+            if j is None:
+                return None
+            chosen = entries[j]
+        return chosen[1], chosen[2]
+
+    @staticmethod
+    def _ensure_leading_zero(value):
+        """str(value) with a leading '0' added unless empty or already there."""
+        s = str(value)
+        return s if not s or s[0] == '0' else '0' + s
+
+    def _enrich_from_extended(self, row, firma_val):
+        """Enrich / correct DEBI_KREDI (and cost centre) from the extended mapping.
+
+        Applies when DEBI_KREDI is missing or shortened. Mutates ``row``.
+        """
+        try:
+            if self.extended_mapping is None:
+                return
+            debi_val = str(row.get('DEBI_KREDI', '')).strip()
+            matched_row = None
+            # Criteria: empty debi OR numeric too short (< 7) OR suffix match exists in extended mapping
+            if (not debi_val) or (len(debi_val) < 7):
+                cand = self.extended_mapping
+                if firma_val and 'FIRMA' in cand.columns:
+                    cand = cand[cand['FIRMA'] == firma_val]
+                # Try exact Kostenträger match (remove leading zero if added)
+                raw_kost = str(row.get('KOSTTRAGER', '')).lstrip('0')
+                k_match = cand[cand['Kostenträger'].str.lstrip('0') == raw_kost]
+                if not k_match.empty:
+                    matched_row = k_match.iloc[0]
+                    row['DEBI_KREDI'] = matched_row['DEBI_KREDI']
+                elif debi_val:
+                    # Fallback: any DEBI_KREDI ending with current debi_val
+                    suf = cand[cand['DEBI_KREDI'].str.endswith(debi_val)]
+                    if not suf.empty:
+                        matched_row = suf.iloc[0]
+                        row['DEBI_KREDI'] = matched_row['DEBI_KREDI']
+            else:
+                # If we have a short value that is suffix of a longer one, replace
+                cand = self.extended_mapping
+                if firma_val and 'FIRMA' in cand.columns:
+                    cand = cand[cand['FIRMA'] == firma_val]
+                suf = cand[cand['DEBI_KREDI'].str.endswith(debi_val)]
+                if not suf.empty and suf.iloc[0]['DEBI_KREDI'] != debi_val:
+                    matched_row = suf.iloc[0]
+                    row['DEBI_KREDI'] = matched_row['DEBI_KREDI']
             
-            self.processed_data.append(row)
-            values = [row.get(col, '') for col in self.columns]
-            self.tree.insert('', tk.END, values=values)
+            # After enriching DEBI_KREDI, also fill cost center fields from matched row
+            if matched_row is not None:
+                if 'Kostenträger' in matched_row:
+                    kosttrager_from_ext = self._ensure_leading_zero(matched_row['Kostenträger'])
+                    row['KOSTTRAGER'] = kosttrager_from_ext
+                    
+                    if len(kosttrager_from_ext) >= 4:
+                        row['KOSTSTELLE'] = kosttrager_from_ext[:4]
+                
+                bez_col = 'Kostenträgerbezeichnung' if 'Kostenträgerbezeichnung' in matched_row else 'Kostenträger Bezeichnung'
+                if bez_col in matched_row:
+                    row['Kostenträgerbezeichnung'] = str(matched_row[bez_col])
+        except Exception:
+            pass
 
     def preview_pdf_matches(self):
         """Preview how many rows will get mapped with current FIRMA."""
@@ -1342,23 +1504,14 @@ class MultiProjectApp:
             if self.mapping_data is None:
                 messagebox.showerror("Fehler", "Keine Mapping-Datenbank geladen.")
                 return
-            firma = ''
-            # Get FIRMA from combobox or entry
-            firma_widget = self.pdf_config_entries.get('FIRMA')
-            if isinstance(firma_widget, ttk.Combobox):
-                firma = firma_widget.get().strip()
-            else:
-                firma = firma_widget.get().strip()
-            df = self.mapping_data
-            if 'FIRMA' in df.columns:
-                df = df[df['FIRMA'].astype(str).str.strip() == str(firma)]
+            firma = self.pdf_config_entries.get('FIRMA', '').strip()
+            key = str(firma) if 'FIRMA' in self.mapping_data.columns else None
+            exact = self._mapping_index.get(key, ({},))[0]
             total = len(self.raw_pdf_data or [])
-            mapped = 0
-            for item in self.raw_pdf_data or []:
-                debi = str(item.get('customer_number', '')).replace(' ', '')
-                exact = df[df['DEBI_KREDI'].astype(str) == debi]
-                if not exact.empty:
-                    mapped += 1
+            mapped = sum(
+                1 for item in self.raw_pdf_data or []
+                if str(item.get('customer_number', '')) in exact
+            )
             messagebox.showinfo(
                 "Vorschau",
                 f"FIRMA {firma}: {mapped}/{total} Einträge mit exaktem Match."
@@ -1398,150 +1551,90 @@ class MultiProjectApp:
             self.excel_transform_btn.config(state=tk.NORMAL)
 
     def transform_excel_data(self):
+        from bereitspf_transformer import transform_excel as bereitspf_transform
         if not self.template_path or not self.source_path:
             return
         
+        self.excel_transform_btn.config(state=tk.DISABLED, text="⏳ Transformiere...")
+        defaults = self.excel_config_entries
+        # The grid may be refilled (project switch, PDF/OCR data) before the
+        # transform finishes; the result is then dropped
+        self._submit_io(
+            partial(self._on_excel_transformed, defaults=defaults,
+                    generation=self._tree_generation),
+            bereitspf_transform,
+            self.source_path,
+            self.template_path,
+            defaults
+        )
+
+    def _on_excel_transformed(self, future, defaults, generation):
+        import pandas as pd
+        self.excel_transform_btn.config(state=tk.NORMAL, text="🔄 Transformieren")
+        if (generation != self._tree_generation
+                or self.current_project != "Excel Transformer"):
+            return
         try:
-            defaults = {
-                k: v.get() for k, v in self.excel_config_entries.items()
-            }
+            self.processed_data = future.result()
+            
+            # Apply mapping database logic (same as PDF Reader), column-wise.
+            # Cells keep the per-row semantics: Python truthiness decides whether
+            # a value is set and str() is used for prefix/length checks.
+            df = pd.DataFrame(self.processed_data, dtype=object)
+            
+            def column(name, default):
+                if name in df.columns:
+                    return df[name].copy()
+                return pd.Series(default, index=df.index, dtype=object)
+            
+            # Default Kostenträger from settings
+            kosttrager = column('KOSTTRAGER', defaults.get('KOSTTRAGER', ''))
+            kost_bez = column('Kostenträgerbezeichnung', '')
+            
+            # New mapping: filter by FIRMA, then closest DEBI_KREDI,
+            # resolved once per distinct customer number
+            if self.mapping_data is not None and not df.empty:
+                firma_input = str(defaults.get('FIRMA', '')).strip()
+                keys = column('DEBI_KREDI', '').map(str).str.replace(' ', '', regex=False)
+                hits = {
+                    key: self._match_mapping(key, firma_input)
+                    for key in keys.unique()
+                }
+                for key, idx in keys.groupby(keys, sort=False).groups.items():
+                    hit = hits[key]
+                    if hit is not None:
+                        kosttrager.loc[idx] = hit[0]
+                        if hit[1] is not None:
+                            kost_bez.loc[idx] = hit[1]
             
-            self.processed_data = bereitspf_transform(
-                self.source_path,
-                self.template_path,
-                defaults=defaults
+            # Logic: Ensure Kostenträger starts with 0
+            kt_set = kosttrager.astype(bool)
+            kt_str = kosttrager.map(str)
+            kosttrager = kosttrager.where(~(kt_set & ~kt_str.str.startswith('0')), '0' + kt_str)
+            kt_str = kosttrager.map(str)
+            
+            # Logic: Koststelle is first 4 digits of Kostenträger, otherwise the
+            # row/default value, which must also start with 0
+            koststelle = column('KOSTSTELLE', defaults.get('KOSTSTELLE', ''))
+            ks_str = koststelle.map(str)
+            koststelle = koststelle.where(
+                ~(koststelle.astype(bool) & ~ks_str.str.startswith('0')), '0' + ks_str
             )
+            koststelle = kt_str.str[:4].where(kt_set & kt_str.str.len().ge(4), koststelle)
+            
+            df['KOSTTRAGER'] = kosttrager
+            df['KOSTSTELLE'] = koststelle
+            df['Kostenträgerbezeichnung'] = kost_bez
+            self.processed_data = df.to_dict('records')
             
-            # Apply mapping database logic (same as PDF Reader)
             for row in self.processed_data:
-                # Get customer/debitor number
-                customer_num = row.get('DEBI_KREDI', '')
-                
-                # Default Kostenträger from settings
-                kosttrager = row.get(
-                    'KOSTTRAGER', defaults.get('KOSTTRAGER', '')
-                )
-                kost_bez = row.get('Kostenträgerbezeichnung', '')
-                
-                # New mapping: filter by FIRMA, then closest DEBI_KREDI
-                if self.mapping_data is not None:
-                    firma_input = str(defaults.get('FIRMA', '')).strip()
-                    debi_kredi_extracted = str(customer_num).replace(' ', '')
-                    df = self.mapping_data.copy()
-                    if firma_input and 'FIRMA' in df.columns:
-                        df = df[df['FIRMA'] == firma_input]
-                    exact = df[df['DEBI_KREDI'] == debi_kredi_extracted]
-                    chosen = None
-                    if not exact.empty:
-                        chosen = exact.iloc[0]
-                    else:
-                        try:
-                            target = int(
-                                ''.join(
-                                    filter(
-                                        str.isdigit,
-                                        debi_kredi_extracted or '0'
-                                    )
-                                )
-                            )
-                            df_num = df.assign(
-                                _num=df['DEBI_KREDI'].apply(
-                                    lambda s: int(
-                                        ''.join(
-                                            filter(str.isdigit, str(s))
-                                        ) or 0
-                                    )
-                                )
-                            )
-                            if not df_num.empty:
-                                df_num = df_num.assign(
-                                    _dist=(df_num['_num'] - target).abs()
-                                )
-                                chosen = df_num.sort_values('_dist').iloc[0]
-                        except Exception:
-                            pass
-                    if chosen is not None:
-                        kosttrager = str(chosen['Kostenträger'])
-                        bez_col = (
-                            'Kostenträger Bezeichnung'
-                            if 'Kostenträger Bezeichnung' in df.columns
-                            else 'Kostenträgerbezeichnung'
-                        )
-                        kost_bez = str(chosen.get(bez_col, kost_bez))
-                
-                # Logic: Ensure Kostenträger starts with 0
-                if kosttrager and not str(kosttrager).startswith('0'):
-                    kosttrager = '0' + str(kosttrager)
-                    
-                # Logic: Koststelle is first 4 digits of Kostenträger
-                if kosttrager and len(str(kosttrager)) >= 4:
-                    koststelle = str(kosttrager)[:4]
-                else:
-                    koststelle = row.get(
-                        'KOSTSTELLE', defaults.get('KOSTSTELLE', '')
-                    )
-                    # Also ensure Koststelle starts with 0
-                    if koststelle and not str(koststelle).startswith('0'):
-                        koststelle = '0' + str(koststelle)
-                
-                # Update row
-                row['KOSTTRAGER'] = kosttrager
-                row['KOSTSTELLE'] = koststelle
-                row['Kostenträgerbezeichnung'] = kost_bez
-
                 # Enrich / correct DEBI_KREDI in transformer mode
-                try:
-                    if self.extended_mapping is not None:
-                        debi_val = str(row.get('DEBI_KREDI', '')).strip()
-                        firma_val = str(defaults.get('FIRMA', '')).strip()
-                        matched_row = None
-                        if (not debi_val) or (len(debi_val) < 7):
-                            cand = self.extended_mapping
-                            if firma_val and 'FIRMA' in cand.columns:
-                                cand = cand[cand['FIRMA'] == firma_val]
-                            raw_kost = str(row.get('KOSTTRAGER', '')).lstrip('0')
-                            k_match = cand[cand['Kostenträger'].str.lstrip('0') == raw_kost]
-                            if not k_match.empty:
-                                matched_row = k_match.iloc[0]
-                                row['DEBI_KREDI'] = matched_row['DEBI_KREDI']
-                            elif debi_val:
-                                suf = cand[cand['DEBI_KREDI'].str.endswith(debi_val)]
-                                if not suf.empty:
-                                    matched_row = suf.iloc[0]
-                                    row['DEBI_KREDI'] = matched_row['DEBI_KREDI']
-                        else:
-                            cand = self.extended_mapping
-                            if firma_val and 'FIRMA' in cand.columns:
-                                cand = cand[cand['FIRMA'] == firma_val]
-                            suf = cand[cand['DEBI_KREDI'].str.endswith(debi_val)]
-                            if not suf.empty and suf.iloc[0]['DEBI_KREDI'] != debi_val:
-                                matched_row = suf.iloc[0]
-                                row['DEBI_KREDI'] = matched_row['DEBI_KREDI']
-                        
-                        # After enriching DEBI_KREDI, also fill cost center fields
-                        if matched_row is not None:
-                            if 'Kostenträger' in matched_row:
-                                kosttrager_from_ext = str(matched_row['Kostenträger'])
-                                if kosttrager_from_ext and not kosttrager_from_ext.startswith('0'):
-                                    kosttrager_from_ext = '0' + kosttrager_from_ext
-                                row['KOSTTRAGER'] = kosttrager_from_ext
-                                
-                                if len(kosttrager_from_ext) >= 4:
-                                    row['KOSTSTELLE'] = kosttrager_from_ext[:4]
-                            
-                            bez_col = 'Kostenträgerbezeichnung' if 'Kostenträgerbezeichnung' in matched_row else 'Kostenträger Bezeichnung'
-                            if bez_col in matched_row:
-                                row['Kostenträgerbezeichnung'] = str(matched_row[bez_col])
-                except Exception:
-                    pass
+                self._enrich_from_extended(
+                    row, str(defaults.get('FIRMA', '')).strip()
+                )
             
             # Clear and repopulate grid
-            for item in self.tree.get_children():
-                self.tree.delete(item)
-                
-            for row in self.processed_data:
-                values = [row.get(col, '') for col in self.columns]
-                self.tree.insert('', tk.END, values=values)
+            self._populate_tree(self.processed_data)
             
             self.excel_export_btn.config(state=tk.NORMAL)
             messagebox.showinfo(
@@ -1555,14 +1648,135 @@ class MultiProjectApp:
             messagebox.showerror("Fehler", str(e))
     
     # Shared Methods
+    def _extraction_cache_path(self, kind, pdf_path):
+        """Cache file for ``kind`` ('pdf' or 'ocr') results of ``pdf_path``, or None if unreadable"""
+        try:
+            key = _pdf_cache_key(pdf_path)
+        except OSError:
+            return None
+        return self.cache_dir / f"{kind}_{key}.pkl"
+
+    def _load_cached_extraction(self, cache_path):
+        if cache_path is None or not cache_path.exists():
+            return None
+        try:
+            version, data = pickle.loads(cache_path.read_bytes())
+        except Exception:
+            return None
+        return data if version == CACHE_VERSION else None
+
+    def _store_cached_extraction(self, cache_path, data):
+        if cache_path is None:
+            return
+        try:
+            self.cache_dir.mkdir(exist_ok=True)
+            tmp_path = cache_path.with_suffix(".tmp")
+            tmp_path.write_bytes(pickle.dumps((CACHE_VERSION, data), protocol=pickle.HIGHEST_PROTOCOL))
+            os.replace(tmp_path, cache_path)
+        except Exception:
+            # The cache is only an optimisation; extraction already succeeded
+            pass
+
+    def _submit(self, on_done, fn, *args):
+        """Run ``fn(*args)`` in the worker pool and call ``on_done(future)`` in the Tk loop."""
+        future = self._get_pool().submit(fn, *args)
+        self._pending.add(future)
+        # Done-callbacks run on the executor's thread, so only enqueue there
+        future.add_done_callback(
+            lambda f: self._ui_queue.put((self._finish_future, (on_done, f)))
+        )
+
+    def _submit_io(self, on_done, fn, *args):
+        """Run ``fn(*args)`` on the I/O thread pool and call ``on_done(future)`` in the Tk loop."""
+        future = self._io_pool.submit(fn, *args)
+        future.add_done_callback(lambda f: self._ui_queue.put((on_done, (f,))))
+
+    def _get_pool(self):
+        """Worker pool sized by the 'Parallele Prozesse' setting; only resized while idle"""
+        try:
+            workers = max(1, int(self.pdf_workers_entry.get()))
+        except ValueError:
+            workers = self._pool_workers
+        if workers != self._pool_workers and not self._pending:
+            self._pool.shutdown(wait=False)
+            self._pool = ProcessPoolExecutor(max_workers=workers)
+            self._pool_workers = workers
+        return self._pool
+
+    def _finish_future(self, on_done, future):
+        self._pending.discard(future)
+        on_done(future)
+
+    def _drain_ui_queue(self):
+        # Reschedule first so a failing callback cannot stop the loop
+        self._ui_after_id = self.root.after(33, self._drain_ui_queue)
+        if self._pending:
+            self._drain_ocr_progress()
+        while True:
+            try:
+                callback, args = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            callback(*args)
+
+    def _on_close(self):
+        self.root.after_cancel(self._ui_after_id)
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+        if self._ocr_manager is not None:
+            self._ocr_manager.shutdown()
+        self.root.destroy()
+
+    def _populate_tree(self, rows):
+        """Replace the data grid contents with ``rows`` (dicts keyed by column).
+
+        Rows go in _TREE_CHUNK at a time from after_idle callbacks so the
+        window stays responsive; a newer call abandons an unfinished fill.
+        """
+        self._tree_generation += 1
+        self._tree_filling = True
+        self.tree.delete(*self.tree.get_children())
+        self._insert_tree_chunk(self._tree_generation, list(rows), 0)
+
+    def _insert_tree_chunk(self, generation, rows, start):
+        if generation != self._tree_generation:
+            return
+        tree = self.tree
+        columns = self._columns_tuple
+        end = start + self._TREE_CHUNK
+        for row in rows[start:end]:
+            tags = ('needs_validation',) if row.get('validation_required', False) else ()
+            tree.insert('', tk.END, values=tuple(row.get(col, '') for col in columns), tags=tags)
+        if end < len(rows):
+            tree.after_idle(self._insert_tree_chunk, generation, rows, end)
+        else:
+            self._tree_filling = False
+
     def on_tree_edit(self, event):
-        self.processed_data = []
-        for item_id in self.tree.get_children():
-            values = self.tree.item(item_id, "values")
-            row = dict(zip(self.columns, values))
-            self.processed_data.append(row)
+        """Sync the edited grid row back into processed_data."""
+        if self.tree.last_edit is not None:
+            item_id, _ = self.tree.last_edit
+            idx = self.tree.index(item_id)
+            if idx < len(self.processed_data):
+                values = self.tree.item(item_id, "values")
+                self.processed_data[idx] = dict(zip(self._columns_tuple, values))
+                return
+        self._sync_processed_data_from_tree()
+
+    def _sync_processed_data_from_tree(self):
+        """Rebuild processed_data from every grid row."""
+        if self._tree_filling:
+            # The grid holds only part of processed_data until the fill ends
+            return
+        columns = self._columns_tuple
+        self.processed_data = [
+            dict(zip(columns, self.tree.item(item_id, "values")))
+            for item_id in self.tree.get_children()
+        ]
 
     def export_excel(self):
+        import pandas as pd
+        from excel_generator import open_excel_writer
         filename = filedialog.asksaveasfilename(
             defaultextension=".xlsx",
             filetypes=[("Excel", "*.xlsx")]
@@ -1571,26 +1785,10 @@ class MultiProjectApp:
             return
         
         try:
-            df = pd.DataFrame(self.processed_data)
-            
-            all_columns = [
-                'SATZART', 'FIRMA', 'BELEG_NR', 'BELEG_DAT',
-                'SOLL_HABEN', 'BUCH_KREIS',
-                'BUCH_JAHR', 'BUCH_MONAT', 'DEBI_KREDI', 'BETRAG',
-                'RECHNUNG', 'leer',
-                'BUCH_TEXT', 'HABENKONTO', 'SOLLKONTO', 'leer_1', 'KOSTSTELLE',
-                'KOSTTRAGER', 'Kostenträgerbezeichnung', 'Bebuchbar',
-                'Debitoren.Bezeichnung',
-                'Debitoren.Aktuelle Anschrift Anschrift-Zusatz',
-                'AbgBenutzerdefiniert'
-            ]
-            
-            for col in all_columns:
-                if col not in df.columns:
-                    df[col] = None
-                    
-            df = df[all_columns]
-            df.to_excel(filename, index=False, engine='openpyxl')
+            # Missing columns come out empty
+            df = pd.DataFrame(self.processed_data, columns=list(self._EXPORT_COLUMNS))
+            with open_excel_writer(filename) as writer:
+                df.to_excel(writer, index=False)
             messagebox.showinfo(
                 "Export erfolgreich",
                 f"✅ Datei erfolgreich gespeichert:\n\n{Path(filename).name}\n\n" +
@@ -1602,6 +1800,7 @@ class MultiProjectApp:
 
 
 def main():
+    multiprocessing.freeze_support()
     root = tk.Tk()
     app = MultiProjectApp(root)
     root.mainloop()
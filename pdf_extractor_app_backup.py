@@ -2,19 +2,77 @@
 PDF Invoice Extractor - Desktop Application
 Modern GUI application for extracting invoice data from PDFs and generating Excel files.
 Features editable grid, template-based text generation, and persistent mapping database.
+
+Optional: python-calamine speeds up reading the mapping workbook and
+xlsxwriter the Excel export; without them openpyxl is used.
 """
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from tkinter import font as tkfont
+import hashlib
+import pickle
+import queue
+import string
 import threading
+import multiprocessing
 from pathlib import Path
-from pdf_extractor import extract_invoices
-from excel_generator import generate_excel
-import pandas as pd
 import shutil
 import os
 
+# Bump whenever the extractor changes its output so stale cache entries are ignored
+CACHE_VERSION = 1
+# Least recently used entries are removed beyond either limit
+CACHE_MAX_ENTRIES = 100
+CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+
+def _file_sha256(path):
+    """SHA-256 of a file's content, read in 1 MB blocks."""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _amounts_to_cents(amounts):
+    """Euro amounts (float64 array, NaN if missing) to int64 cents.
+
+    Truncates like int(amount * 100); missing amounts become 0.
+    """
+    import numpy as np
+    cents = np.trunc(amounts * 100)
+    cents[~np.isfinite(cents)] = 0
+    return cents.astype(np.int64)
+
+
+def _read_excel_fast(path, **kwargs):
+    """pd.read_excel via the calamine engine when available, else openpyxl."""
+    import pandas as pd
+    try:
+        return pd.read_excel(path, engine='calamine', **kwargs)
+    except (ImportError, ValueError):
+        # python-calamine missing, or pandas < 2.2 ("Unknown engine")
+        return pd.read_excel(path, engine='openpyxl', **kwargs)
+
+
+def _customer_keys(raw_data):
+    """Mapping keys for extracted rows: customer_number without spaces, None if empty."""
+    import pandas as pd
+    cust = pd.Series([item.get('customer_number', '') for item in raw_data], dtype=object)
+    return cust.map(str).str.replace(' ', '', regex=False).where(cust.astype(bool))
+
+
+def _preload_modules():
+    """Import the heavy data modules in the background."""
+    try:
+        import pandas
+        import pdf_extractor
+    except ImportError:
+        # Reported properly when the module is actually used
+        pass
+
 
 class ModernStyle:
     """Color scheme and styling constants"""
@@ -35,6 +93,18 @@ class EditableTreeview(ttk.Treeview):
         super().__init__(master, **kw)
         self.bind("<Double-1>", self.on_double_click)
         self.root = master.winfo_toplevel()
+        
+        # One overlay Entry is reused for every edit; the cell being
+        # edited is tracked in _edit_row / _edit_col
+        self._edit_entry = tk.Entry(self, bg=ModernStyle.BG_INPUT, fg=ModernStyle.TEXT_PRIMARY, 
+                                    insertbackground=ModernStyle.TEXT_PRIMARY, relief=tk.FLAT)
+        self._edit_row = None
+        self._edit_col = None
+        # (item, column index) of the last saved edit, for <<TreeviewEdit>> handlers
+        self.last_edit = None
+        self._edit_entry.bind("<Return>", self._save_edit)
+        self._edit_entry.bind("<FocusOut>", self._save_edit)
+        self._edit_entry.bind("<Escape>", self._cancel_edit)
 
     def on_double_click(self, event):
         """Handle double click to edit cell"""
@@ -58,31 +128,35 @@ class EditableTreeview(ttk.Treeview):
         # Get cell coordinates
         x, y, width, height = self.bbox(row_id, column)
         
-        # Create entry widget
-        entry = tk.Entry(self, bg=ModernStyle.BG_INPUT, fg=ModernStyle.TEXT_PRIMARY, 
-                        insertbackground=ModernStyle.TEXT_PRIMARY, relief=tk.FLAT)
-        entry.place(x=x, y=y, width=width, height=height)
-        entry.insert(0, current_value)
-        entry.select_range(0, tk.END)
-        entry.focus()
-        
-        def save_edit(event=None):
-            new_value = entry.get()
-            current_values = list(self.item(row_id, "values"))
-            current_values[col_idx] = new_value
-            self.item(row_id, values=current_values)
-            entry.destroy()
-            
-            # Trigger event for app to update data model
-            self.event_generate("<<TreeviewEdit>>")
-            
-        def cancel_edit(event=None):
-            entry.destroy()
-            
-        entry.bind("<Return>", save_edit)
-        entry.bind("<FocusOut>", save_edit)
-        entry.bind("<Escape>", cancel_edit)
-
+        # Move the shared entry over the cell
+        self._edit_row = row_id
+        self._edit_col = col_idx
+        self._edit_entry.delete(0, tk.END)
+        self._edit_entry.insert(0, current_value)
+        self._edit_entry.select_range(0, tk.END)
+        self._edit_entry.place(x=x, y=y, width=width, height=height)
+        self._edit_entry.focus()
+        
+    def _save_edit(self, event=None):
+        row_id, col_idx = self._edit_row, self._edit_col
+        if row_id is None:
+            return
+        self._edit_row = None
+        self._edit_entry.place_forget()
+        if not self.exists(row_id):
+            return
+        new_value = self._edit_entry.get()
+        current_values = list(self.item(row_id, "values"))
+        current_values[col_idx] = new_value
+        self.item(row_id, values=current_values)
+        self.last_edit = (row_id, col_idx)
+        
+        # Trigger event for app to update data model
+        self.event_generate("<<TreeviewEdit>>")
+        
+    def _cancel_edit(self, event=None):
+        self._edit_row = None
+        self._edit_entry.place_forget()
 
 class PDFExtractorApp:
     def __init__(self, root):
@@ -106,15 +180,19 @@ class PDFExtractorApp:
         
         # Data storage
         self.raw_data = []      # Original extracted data
-        self.processed_data = [] # Data with accounting columns applied
+        self._cust_keys = None  # Normalized customer numbers of raw_data, see _customer_keys
+        self.processed_data = [] # Rows with accounting columns applied, as tuples in self.columns order
         self.pdf_path = None
         self.last_saved_excel = None
         self.mapping_data = None # DataFrame for mapping
+        self._progress_queue = None # Extraction thread -> Tk messages, see _drain_queue
         
         # Persistent storage setup
         self.data_dir = Path("data")
         self.data_dir.mkdir(exist_ok=True)
         self.mapping_file_path = self.data_dir / "mapping_db.xlsx"
+        # Extracted raw_data per PDF, keyed by content hash
+        self.cache_dir = self.data_dir / "extraction_cache"
         
         # Configure custom fonts
         self.title_font = tkfont.Font(family="Segoe UI", size=24, weight="bold")
@@ -127,8 +205,12 @@ class PDFExtractorApp:
         # Create UI
         self.create_widgets()
         
-        # Auto-load mapping file if exists
-        self.load_stored_mapping()
+        # pandas is imported lazily; warm it up off the Tk thread so the
+        # window shows first and the first extract/mapping load is not slowed
+        threading.Thread(target=_preload_modules, daemon=True).start()
+        
+        # Auto-load mapping file if exists (once the window is up)
+        self.root.after(0, self.load_stored_mapping)
         
     def setup_styles(self):
         """Configure ttk styles for modern look"""
@@ -364,20 +446,103 @@ class PDFExtractorApp:
         if not self.pdf_path: return
         self.status_label.config(text="⏳ Extrahiere...", fg=ModernStyle.TEXT_SECONDARY)
         self.extract_btn.config(state=tk.DISABLED)
-        threading.Thread(target=self._extract_thread).start()
+        # Tk must only be touched from the main thread, so the worker only
+        # posts messages and the Tk loop polls them
+        self._progress_queue = queue.Queue()
+        threading.Thread(target=self._extract_thread, args=(self.pdf_path, self._progress_queue), daemon=True).start()
+        self.root.after(100, self._drain_queue)
 
-    def _extract_thread(self):
+    def _extract_thread(self, pdf_path, progress_queue):
         try:
-            self.raw_data = extract_invoices(self.pdf_path)
-            self.root.after(0, self._extraction_complete)
+            from pdf_extractor import extract_invoices_parallel
+            cache_path = self.cache_dir / f"pdf_{_file_sha256(pdf_path)}.pkl"
+            raw_data = self._load_cached_extraction(cache_path)
+            if raw_data is None:
+                # Pages are parsed in worker processes; threads would share the GIL
+                raw_data = extract_invoices_parallel(
+                    pdf_path,
+                    progress_callback=lambda done, total: progress_queue.put(('progress', done, total))
+                )
+                self._store_cached_extraction(cache_path, raw_data)
+            progress_queue.put(('done', raw_data))
         except Exception as e:
-            self.root.after(0, lambda: messagebox.showerror("Fehler", str(e)))
+            progress_queue.put(('error', str(e)))
+        progress_queue.put(None)
+
+    def _load_cached_extraction(self, cache_path):
+        if not cache_path.exists():
+            return None
+        try:
+            version, data = pickle.loads(cache_path.read_bytes())
+        except Exception:
+            return None
+        if version != CACHE_VERSION:
+            return None
+        try:
+            # mtime is the LRU clock (atime is often not updated)
+            os.utime(cache_path)
+        except OSError:
+            pass
+        return data
+
+    def _store_cached_extraction(self, cache_path, data):
+        try:
+            self.cache_dir.mkdir(exist_ok=True)
+            tmp_path = cache_path.with_suffix(".tmp")
+            tmp_path.write_bytes(pickle.dumps((CACHE_VERSION, data), protocol=pickle.HIGHEST_PROTOCOL))
+            os.replace(tmp_path, cache_path)
+            self._trim_extraction_cache()
+        except Exception:
+            # The cache is only an optimisation; extraction already succeeded
+            pass
+
+    def _trim_extraction_cache(self):
+        """Remove the least recently used entries beyond the cache limits."""
+        entries = []
+        for path in self.cache_dir.glob("pdf_*.pkl"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+        entries.sort(reverse=True)
+        total = 0
+        for count, (_, size, path) in enumerate(entries, 1):
+            total += size
+            if count > 1 and (count > CACHE_MAX_ENTRIES or total > CACHE_MAX_BYTES):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    def _drain_queue(self):
+        """Handle the extraction thread's messages until its closing None."""
+        while True:
+            try:
+                msg = self._progress_queue.get_nowait()
+            except queue.Empty:
+                self.root.after(100, self._drain_queue)
+                return
+            if msg is None:
+                return
+            if msg[0] == 'progress':
+                self.status_label.config(text=f"⏳ Extrahiere... Seite {msg[1]}/{msg[2]}", fg=ModernStyle.TEXT_SECONDARY)
+            elif msg[0] == 'done':
+                self.raw_data = msg[1]
+                self._extraction_complete()
+            else:
+                self.status_label.config(text="❌ Fehler", fg='#f15e64')
+                self.extract_btn.config(state=tk.NORMAL)
+                messagebox.showerror("Fehler", msg[1])
 
     def _extraction_complete(self):
         self.status_label.config(text=f"✅ {len(self.raw_data)} Einträge", fg=ModernStyle.SUCCESS)
         self.extract_btn.config(state=tk.NORMAL)
         self.generate_btn.config(state=tk.NORMAL)
         
+        # Mapping keys only depend on the extraction, not on the settings
+        self._cust_keys = _customer_keys(self.raw_data)
+        
         # Initial processing with default settings
         self.apply_global_settings()
 
@@ -388,7 +553,7 @@ class PDFExtractorApp:
         
         try:
             # Verify file structure
-            df = pd.read_excel(filename)
+            df = _read_excel_fast(filename)
             
             # Column mapping (User File -> Internal Standard)
             column_map = {
@@ -432,11 +597,28 @@ class PDFExtractorApp:
         """Load mapping file from storage"""
         if self.mapping_file_path.exists():
             try:
-                self.mapping_data = pd.read_excel(self.mapping_file_path)
+                df = _read_excel_fast(self.mapping_file_path)
+                # Rows without a Kundennummer can never match; drop them before
+                # astype(str) turns empty cells into 'nan'
+                df = df.dropna(subset=['Kundennummer'])
                 # Ensure Kundennummer is string for matching
-                self.mapping_data['Kundennummer'] = self.mapping_data['Kundennummer'].astype(str).str.replace(' ', '')
+                df['Kundennummer'] = df['Kundennummer'].astype(str).str.replace(' ', '')
+                df = df[df['Kundennummer'] != '']
+                # Index by Kundennummer (first row wins for duplicates) so lookups
+                # are hash probes; values are kept as the strings the grid shows
+                df = df.drop_duplicates('Kundennummer').set_index('Kundennummer')
+                kt = df['Kostenträger'].map(str)
+                # Kostenträger rules applied once here rather than per invoice:
+                # leading 0, and Koststelle is its first 4 digits (NaN if too
+                # short; apply_global_settings then uses the default)
+                kt = kt.where(~(kt.astype(bool) & ~kt.str.startswith('0')), '0' + kt)
+                df['Kostenträger'] = kt
+                df['_koststelle'] = kt.str[:4].where(kt.str.len().ge(4))
+                df['Kostenträgerbezeichnung'] = df['Kostenträgerbezeichnung'].map(str)
+                self.mapping_data = df
                 self.mapping_status.config(text="✅ Datenbank aktiv", fg=ModernStyle.SUCCESS)
             except Exception as e:
+                self.mapping_data = None
                 self.mapping_status.config(text="❌ Fehler in Datenbank", fg='#f15e64')
         else:
             self.mapping_status.config(text="Keine Datenbank geladen", fg=ModernStyle.TEXT_SECONDARY)
@@ -444,105 +626,145 @@ class PDFExtractorApp:
     def apply_global_settings(self):
         """Apply global settings to all rows and update grid"""
         if not self.raw_data: return
+        import numpy as np
+        import pandas as pd
         
         # Get current settings
         settings = {k: v.get() for k, v in self.config_entries.items()}
         buch_text_template = self.buch_text_entry.get()
         
-        self.processed_data = []
+        # Build all rows column-wise instead of one dict per invoice
+        # (item.get per field, so a key missing from one invoice reads as '')
+        fields = {'invoice_number': '', 'invoice_date': '', 'customer_number': '',
+                  'student_name': '', 'subject': '', 'school': '', 'month_year': '',
+                  'amount': 0}
+        raw = pd.DataFrame({
+            col: [item.get(col, default) for item in self.raw_data]
+            for col, default in fields.items()
+        }, dtype=object)
+        
+        # Format date (unparseable or missing dates stay empty). Invoices use
+        # DD.MM.YYYY: parse that fixed format in one pass and leave only the
+        # stragglers to pandas' per-value format inference
+        dates = pd.to_datetime(raw['invoice_date'], format='%d.%m.%Y', errors='coerce')
+        retry = dates.isna() & raw['invoice_date'].notna()
+        if retry.any():
+            dates[retry] = pd.to_datetime(raw['invoice_date'][retry], dayfirst=True, errors='coerce', format='mixed')
+        valid = dates.notna()
+        beleg_dat = dates.dt.strftime('%Y%m%d').where(valid, '')
+        buch_jahr = dates.dt.year.astype('Int64').astype(object).where(valid, '')
+        buch_monat = dates.dt.month.astype('Int64').astype(object).where(valid, '')
+        
+        # Format amount (cents)
+        betrag = _amounts_to_cents(
+            pd.to_numeric(raw['amount'], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan))
+        
+        # Generate BUCH_TEXT from template, parsed once. Plain {name}
+        # placeholders are filled column-wise; anything else (format specs,
+        # conversions, unknown names) goes through str.format per row
+        placeholders = {
+            'student': raw['student_name'], 'subject': raw['subject'],
+            'school': raw['school'], 'month': raw['month_year'],
+        }
+        parsed = list(string.Formatter().parse(buch_text_template))
+        if all(field is None or (field in placeholders and not spec and conversion is None)
+               for _, field, spec, conversion in parsed):
+            buch_text = pd.Series('', index=raw.index, dtype=object)
+            for literal, field, _, _ in parsed:
+                buch_text = buch_text + literal
+                if field is not None:
+                    buch_text = buch_text + placeholders[field].map(str)
+        else:
+            buch_text = [
+                buch_text_template.format(student=student, subject=subject, school=school, month=month)
+                for student, subject, school, month in zip(
+                    raw['student_name'], raw['subject'], raw['school'], raw['month_year'])
+            ]
         
-        # Clear tree
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-            
-        # Process each row
-        for item in self.raw_data:
-            # Format date
-            beleg_dat = ""
-            buch_jahr = ""
-            buch_monat = ""
-            if item.get('invoice_date'):
-                try:
-                    date_obj = pd.to_datetime(item['invoice_date'], dayfirst=True)
-                    beleg_dat = date_obj.strftime('%Y%m%d')
-                    buch_jahr = date_obj.year
-                    buch_monat = date_obj.month
-                except: pass
-                
-            # Format amount (cents)
-            betrag = int(item.get('amount', 0) * 100)
-            
-            # Generate BUCH_TEXT from template
-            buch_text = buch_text_template.format(
-                student=item.get('student_name', ''),
-                subject=item.get('subject', ''),
-                school=item.get('school', ''),
-                month=item.get('month_year', '')
-            )
-            
-            # Determine Kostenträger info (Default vs Mapping)
-            kosttrager = settings['KOSTTRAGER']
-            kost_bez = settings['Kostenträgerbezeichnung']
-            
-            # Check mapping file
-            if self.mapping_data is not None and item.get('customer_number'):
-                cust_num = str(item.get('customer_number')).replace(' ', '')
-                match = self.mapping_data[self.mapping_data['Kundennummer'] == cust_num]
-                if not match.empty:
-                    kosttrager = str(match.iloc[0]['Kostenträger'])
-                    kost_bez = str(match.iloc[0]['Kostenträgerbezeichnung'])
-            
-            # Logic: Ensure Kostenträger starts with 0
-            if kosttrager and not kosttrager.startswith('0'):
-                kosttrager = '0' + kosttrager
-                
-            # Logic: Koststelle is first 4 digits of Kostenträger
-            koststelle = kosttrager[:4] if kosttrager and len(kosttrager) >= 4 else settings['KOSTSTELLE']
-            
-            row = {
-                'SATZART': settings['SATZART'],
-                'FIRMA': settings['FIRMA'],
-                'BELEG_NR': item.get('invoice_number', ''),
-                'BELEG_DAT': beleg_dat,
-                'SOLL_HABEN': settings['SOLL_HABEN'],
-                'BUCH_KREIS': settings['BUCH_KREIS'],
-                'BUCH_JAHR': buch_jahr,
-                'BUCH_MONAT': buch_monat,
-                'DEBI_KREDI': item.get('customer_number', ''),
-                'BETRAG': betrag,
-                'RECHNUNG': item.get('invoice_number', ''),
-                'BUCH_TEXT': buch_text,
-                'HABENKONTO': settings['HABENKONTO'],
-                'KOSTSTELLE': koststelle,
-                'KOSTTRAGER': kosttrager,
-                'Kostenträgerbezeichnung': kost_bez,
-                'Bebuchbar': settings['Bebuchbar']
-            }
-            
-            self.processed_data.append(row)
-            
-            # Add to tree
-            values = [row.get(col, '') for col in self.columns]
-            self.tree.insert('', tk.END, values=values)
+        # Default Kostenträger. Logic: ensure it starts with 0, and
+        # Koststelle is its first 4 digits (mapping values come prepared)
+        default_kt = settings['KOSTTRAGER']
+        if default_kt and not default_kt.startswith('0'):
+            default_kt = '0' + default_kt
+        default_ks = default_kt[:4] if len(default_kt) >= 4 else settings['KOSTSTELLE']
+        
+        # Determine Kostenträger info (Default vs Mapping)
+        kosttrager = pd.Series(default_kt, index=raw.index, dtype=object)
+        kost_bez = pd.Series(settings['Kostenträgerbezeichnung'], index=raw.index, dtype=object)
+        koststelle = pd.Series(default_ks, index=raw.index, dtype=object)
+        if self.mapping_data is not None:
+            if self._cust_keys is None or len(self._cust_keys) != len(self.raw_data):
+                self._cust_keys = _customer_keys(self.raw_data)
+            pos = self.mapping_data.index.get_indexer(self._cust_keys)
+            matched = pos >= 0
+            kosttrager[matched] = self.mapping_data['Kostenträger'].to_numpy()[pos[matched]]
+            kost_bez[matched] = self.mapping_data['Kostenträgerbezeichnung'].to_numpy()[pos[matched]]
+            koststelle[matched] = self.mapping_data['_koststelle'].to_numpy()[pos[matched]]
+            koststelle = koststelle.fillna(settings['KOSTSTELLE'])
+        
+        processed = pd.DataFrame({
+            'SATZART': settings['SATZART'],
+            'FIRMA': settings['FIRMA'],
+            'BELEG_NR': raw['invoice_number'],
+            'BELEG_DAT': beleg_dat,
+            'SOLL_HABEN': settings['SOLL_HABEN'],
+            'BUCH_KREIS': settings['BUCH_KREIS'],
+            'BUCH_JAHR': buch_jahr,
+            'BUCH_MONAT': buch_monat,
+            'DEBI_KREDI': raw['customer_number'],
+            'BETRAG': betrag,
+            'RECHNUNG': raw['invoice_number'],
+            'BUCH_TEXT': buch_text,
+            'HABENKONTO': settings['HABENKONTO'],
+            'KOSTSTELLE': koststelle,
+            'KOSTTRAGER': kosttrager,
+            'Kostenträgerbezeichnung': kost_bez,
+            'Bebuchbar': settings['Bebuchbar']
+        }, index=raw.index)
+        self.processed_data = list(processed[self.columns].itertuples(index=False, name=None))
+        
+        # Refill tree; taken out of the layout meanwhile so Tk does not
+        # recompute geometry and scrollbars after every change
+        self.tree.grid_remove()
+        try:
+            children = self.tree.get_children()
+            if len(children) == len(self.processed_data):
+                # Same rows (re-applied settings): update them in place
+                item = self.tree.item
+                for item_id, values in zip(children, self.processed_data):
+                    item(item_id, values=values)
+            else:
+                self.tree.delete(*children)
+                insert = self.tree.insert
+                for values in self.processed_data:
+                    insert('', tk.END, values=values)
+        finally:
+            self.tree.grid()
             
     def on_tree_edit(self, event):
         """Update processed_data when tree is edited"""
-        # Rebuild processed_data from tree items
-        self.processed_data = []
-        for item_id in self.tree.get_children():
-            values = self.tree.item(item_id, "values")
-            row = dict(zip(self.columns, values))
-            self.processed_data.append(row)
+        # Only the edited row changed; re-read just that one
+        if self.tree.last_edit is not None:
+            item_id, _ = self.tree.last_edit
+            idx = self.tree.index(item_id)
+            if idx < len(self.processed_data):
+                self.processed_data[idx] = tuple(self.tree.item(item_id, "values"))
+                return
+        
+        # Fall back to rebuilding processed_data from all tree items
+        self.processed_data = [
+            tuple(self.tree.item(item_id, "values"))
+            for item_id in self.tree.get_children()
+        ]
 
     def generate_excel_new(self):
+        import pandas as pd
+        from excel_generator import open_excel_writer
         filename = filedialog.asksaveasfilename(defaultextension=".xlsx", filetypes=[("Excel", "*.xlsx")])
         if not filename: return
         
         try:
-            # Create DataFrame from current grid data
-            df = pd.DataFrame(self.processed_data)
-            
-            # Ensure all 23 columns exist (fill missing with None)
+            # All 23 export columns in order
             all_columns = [
                 'SATZART', 'FIRMA', 'BELEG_NR', 'BELEG_DAT', 'SOLL_HABEN', 'BUCH_KREIS',
                 'BUCH_JAHR', 'BUCH_MONAT', 'DEBI_KREDI', 'BETRAG', 'RECHNUNG', 'leer',
@@ -552,21 +774,19 @@ class PDFExtractorApp:
                 'AbgBenutzerdefiniert'
             ]
             
-            for col in all_columns:
-                if col not in df.columns:
-                    df[col] = None
-                    
-            # Reorder columns
-            df = df[all_columns]
+            # Create DataFrame from current grid data; columns not in the grid come out empty
+            df = pd.DataFrame(self.processed_data, columns=self.columns).reindex(columns=all_columns)
             
             # Save
-            df.to_excel(filename, index=False, engine='openpyxl')
+            with open_excel_writer(filename) as writer:
+                df.to_excel(writer, index=False)
             messagebox.showinfo("Erfolg", f"Datei gespeichert:\n{Path(filename).name}")
             
         except Exception as e:
             messagebox.showerror("Fehler", str(e))
 
 def main():
+    multiprocessing.freeze_support()
     root = tk.Tk()
     app = PDFExtractorApp(root)
     root.mainloop()
@@ -8,9 +8,10 @@ output_df = pd.read_excel('reference_outputs/output_final.xlsx')
 print("WORKING OUTPUT STRUCTURE:")
 print(f"Columns ({len(output_df.columns)}): {output_df.columns.tolist()}")
 print(f"Rows: {len(output_df)}")
+first_row = output_df.iloc[0].to_dict()
 print("\nSample row:")
 for col in output_df.columns[:10]:
-    print(f"  {col}: {output_df.iloc[0][col]}")
+    print(f"  {col}: {first_row[col]}")
 
 # Save to text file for reference
 with open('working_output_structure.txt', 'w', encoding='utf-8') as f:
@@ -21,6 +22,6 @@ with open('working_output_structure.txt', 'w', encoding='utf-8') as f:
     f.write(f"Total rows: {len(output_df)}\n")
     f.write("\nFirst row values:\n")
     for col in output_df.columns:
-        f.write(f"  {col}: {output_df.iloc[0][col]}\n")
+        f.write(f"  {col}: {first_row[col]}\n")
 
 print("\n✅ Saved structure to working_output_structure.txt")